@@ -5,25 +5,46 @@ import uuid
 import csv
 import io
 import zipfile
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, send_from_directory, send_file, abort
-from werkzeug.utils import secure_filename
+import shutil
+import base64
+import itertools
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, send_from_directory, send_file, abort, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from authlib.integrations.flask_client import OAuth
+from werkzeug.security import generate_password_hash
+import orjson
 from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import text, select, bindparam, update, delete, exists, case, func, or_
+from sqlalchemy.orm import selectinload, defer, load_only, aliased
 
 # Import database and models from models.py
 from models import (
     db, User, Script, ScriptVariantRequirement, Submission,
-    BillingRecord, Language, PricingRate, AppSettings
+    BillingRecord, Language, PricingRate, AppSettings, count_words
 )
 
 # Import utilities from utils.py
 from utils import (
     get_app_setting, get_show_earnings, set_app_setting,
-    require_auth, require_role, inject_common_variables
+    require_auth, require_role, inject_common_variables,
+    cached, invalidate_cache, current_user_profile, load_app_settings,
+    WEBVIEW_FALLBACK_ENABLED, UPSERT_INSERTS
 )
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize JSON with orjson; datetimes come out as ISO 8601, other non-native types go through Flask's default"""
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Production-ready configuration
 is_production = os.environ.get('FLASK_ENV') == 'production'
@@ -58,13 +79,67 @@ app.config['WTF_CSRF_ENABLED'] = is_production
 # Enhanced database configuration for PostgreSQL connection stability
 app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
     'pool_pre_ping': True,      # Test connections before use to catch dropped connections
-    'pool_recycle': 300,        # Recycle connections every 5 minutes
-    'pool_timeout': 20,         # Timeout for getting connection from pool
-    'pool_size': 5,             # Number of connections to keep open
-    'max_overflow': 10,         # Additional connections if pool is full
+    'pool_recycle': 280,        # Recycle connections before typical 5-minute idle cutoffs
+    'query_cache_size': 1200,   # Compiled-statement cache; room for every distinct query the app issues
     'echo': False               # Set to True for SQL debugging if needed
 }
-app.config['UPLOAD_FOLDER'] = 'uploads'
+if database_url not in ('sqlite://', 'sqlite:///:memory:'):
+    # In-memory SQLite (the test suite) gets a single-connection StaticPool, which takes no sizing
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].update({
+        'pool_timeout': 20,         # Timeout for getting connection from pool
+        # Sized per Gunicorn worker process, so the totals multiply by the worker count
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 2)),        # Connections kept open
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 6)),  # Extra connections, one per gthread thread in total
+    })
+if database_url.startswith(('postgres://', 'postgresql')):
+    # TCP keepalives let libpq notice connections a server or cloud proxy dropped while
+    # idle, and connect_timeout bounds how long opening a replacement may take
+    app.config['SQLALCHEMY_ENGINE_OPTIONS']['connect_args'] = {
+        'keepalives': 1,
+        'keepalives_idle': 30,
+        'keepalives_interval': 10,
+        'keepalives_count': 5,
+        'connect_timeout': 5
+    }
+# Bound once at import so request handlers don't go through app.config for it
+UPLOAD_FOLDER = app.config['UPLOAD_FOLDER'] = 'uploads'
+# Normalized once; every resolved audio path must stay under this prefix
+UPLOAD_ROOT = os.path.normpath(UPLOAD_FOLDER)
+# Directories searched for a stored recording, newest layout first
+AUDIO_SEARCH_DIRS = (UPLOAD_ROOT, os.path.join(UPLOAD_ROOT, 'audio'))
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_CONTENT_LENGTH', 50 * 1024 * 1024))  # Match nginx client_max_body_size
+
+# Buffer size used when streaming raw upload bodies to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Audio extensions kept from the uploaded filename (the audio endpoint picks the mimetype from it)
+ALLOWED_AUDIO_EXTENSIONS = frozenset({'webm', 'wav', 'mp3', 'mp4', 'm4a', 'ogg'})
+# Mimetype served for each stored extension; anything else is sent as audio/webm
+AUDIO_MIMETYPES = {
+    '.wav': 'audio/wav',
+    '.mp3': 'audio/mpeg',
+    '.mp4': 'audio/mp4',
+    '.m4a': 'audio/mp4',
+    '.ogg': 'audio/ogg',
+}
+
+# Earnings page lists only the latest records; totals cover all of them
+EARNINGS_RECENT_LIMIT = 50
+
+# Exports resolve scripts and submitter names with one IN query per this many submissions
+EXPORT_BATCH_SIZE = 1000
+
+# Parallel unlinks when deleting the audio of many submissions at once
+AUDIO_DELETE_WORKERS = 16
+
+# Active language list served by /api/languages changes rarely; cache it per process
+ACTIVE_LANGUAGES_CACHE_KEY = 'languages_active'
+LANGUAGES_BY_CODE_CACHE_KEY = 'languages_by_code'
+LANGUAGES_CACHE_TTL = 300  # seconds
+
+# Per-language pricing rows used when approving and by the pricing API
+PRICING_CACHE_KEY = 'pricing_rates'
+PRICING_CACHE_TTL = 300  # seconds
 
 # Universal session configuration (works for both dev and production)
 app.config['SESSION_COOKIE_NAME'] = 'voicescript_session'
@@ -78,7 +153,7 @@ app.config['GOOGLE_CLIENT_ID'] = os.environ.get('GOOGLE_CLIENT_ID')
 app.config['GOOGLE_CLIENT_SECRET'] = os.environ.get('GOOGLE_CLIENT_SECRET')
 
 # Ensure required directories exist FIRST (before logging)
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 if is_production:
     os.makedirs('logs', exist_ok=True)
 
@@ -112,38 +187,62 @@ if app.config['GOOGLE_CLIENT_ID'] and app.config['GOOGLE_CLIENT_SECRET']:
         client_secret=app.config['GOOGLE_CLIENT_SECRET'],
         server_metadata_url='https://accounts.google.com/.well-known/openid_configuration',
         client_kwargs={
-            'scope': 'openid email profile'
+            'scope': 'openid email profile',
+            'default_timeout': 10
         }
     )
+    
+    # Fetch the discovery document and signing keys once at startup (inherited by
+    # workers via preload_app) instead of on the first login; Authlib keeps both
+    # in server_metadata and only refetches the JWKS when a key is missing
+    try:
+        google.load_server_metadata()
+        google.fetch_jwk_set()
+    except Exception as e:
+        app.logger.warning(f'Could not preload Google OAuth metadata, will retry on first login: {str(e)}')
 
 # Register context processor
 app.context_processor(inject_common_variables)
 
 # Routes
+# Dashboard endpoint for each role; unknown roles land on the provider dashboard
+DASHBOARD_ENDPOINTS = {
+    'admin': 'admin_dashboard',
+    'reviewer': 'reviewer_dashboard',
+    'provider': 'provider_dashboard'
+}
+
+def redirect_to_dashboard(role):
+    """Redirect to the dashboard for the given user role"""
+    return redirect(url_for(DASHBOARD_ENDPOINTS.get(role, 'provider_dashboard')))
+
+def _session_identity(user):
+    """Return the (id, role, display name) a login stores in the session"""
+    return user.id, user.role, f"{user.first_name} {user.last_name}"
+
+def _start_session(user_id, user_role, user_name):
+    """Replace any old session data with the user's identity, with explicit permanence"""
+    # Assigning keys marks the session modified, so no explicit session.modified is needed
+    session.clear()
+    session.permanent = True
+    session['user_id'] = user_id
+    session['user_role'] = user_role
+    session['user_name'] = user_name
+
 @app.route('/')
 def index():
     if 'user_id' not in session:
         return render_template('landing.html')
 
     user_role = session['user_role']
-    if user_role == 'admin':
-        return redirect(url_for('admin_dashboard'))
-    elif user_role == 'reviewer':
-        return redirect(url_for('reviewer_dashboard'))
-    else:
-        return redirect(url_for('provider_dashboard'))
+    return redirect_to_dashboard(user_role)
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     # If already logged in, redirect to dashboard
     if 'user_id' in session:
         user_role = session.get('user_role', 'provider')
-        if user_role == 'admin':
-            return redirect(url_for('admin_dashboard'))
-        elif user_role == 'reviewer':
-            return redirect(url_for('reviewer_dashboard'))
-        else:
-            return redirect(url_for('provider_dashboard'))
+        return redirect_to_dashboard(user_role)
     
     # Handle demo login via URL parameter
     demo_role = request.args.get('demo')
@@ -151,28 +250,16 @@ def login():
         email = f"{demo_role}@demo.com"
         user = User.query.filter_by(email=email).first()
         if user:
-            # Store user info in the session with explicit permanence
-            session.clear()  # Clear any old session data
-            session.permanent = True
-            session['user_id'] = user.id
-            session['user_role'] = user.role
-            session['user_name'] = f"{user.first_name} {user.last_name}"
-            session.modified = True
+            _start_session(*_session_identity(user))
             
             app.logger.info(f"Demo login: {email} -> {user.role} (ID: {user.id})")
             flash('Login successful!', 'success')
 
             # Create response and redirect to appropriate dashboard
-            if user.role == 'admin':
-                response = redirect(url_for('admin_dashboard'))
-            elif user.role == 'reviewer':
-                response = redirect(url_for('reviewer_dashboard'))
-            else:
-                response = redirect(url_for('provider_dashboard'))
+            response = redirect_to_dashboard(user.role)
             
             # Only set fallback cookie in development mode with explicit flag (SECURITY)
-            enable_fallback = os.environ.get('ENABLE_WEBVIEW_FALLBACK', 'false').lower() == 'true'
-            if enable_fallback and not is_production:
+            if WEBVIEW_FALLBACK_ENABLED:
                 response.set_cookie('voicescript_session', 
                                   value=f"{user.id}:{user.role}:{user.first_name} {user.last_name}",
                                   max_age=3600,
@@ -188,28 +275,16 @@ def login():
 
         user = User.query.filter_by(email=email).first()
         if user and user.check_password(password):
-            # Store user info in the session with explicit permanence
-            session.clear()  # Clear any old session data
-            session.permanent = True
-            session['user_id'] = user.id
-            session['user_role'] = user.role
-            session['user_name'] = f"{user.first_name} {user.last_name}"
-            session.modified = True
+            _start_session(*_session_identity(user))
             
             app.logger.info(f"User login: {email} -> {user.role} (ID: {user.id})")
             flash('Login successful!', 'success')
 
             # Create response and redirect to appropriate dashboard
-            if user.role == 'admin':
-                response = redirect(url_for('admin_dashboard'))
-            elif user.role == 'reviewer':
-                response = redirect(url_for('reviewer_dashboard'))
-            else:
-                response = redirect(url_for('provider_dashboard'))
+            response = redirect_to_dashboard(user.role)
             
             # Only set fallback cookie in development mode with explicit flag (SECURITY)
-            enable_fallback = os.environ.get('ENABLE_WEBVIEW_FALLBACK', 'false').lower() == 'true'
-            if enable_fallback and not is_production:
+            if WEBVIEW_FALLBACK_ENABLED:
                 response.set_cookie('voicescript_session', 
                                   value=f"{user.id}:{user.role}:{user.first_name} {user.last_name}",
                                   max_age=3600,
@@ -248,18 +323,21 @@ def google_callback():
         user_info = token.get('userinfo')
         
         if user_info:
-            # Check if user exists
-            user = User.query.filter_by(google_id=user_info['sub']).first()
+            # One query finds both a returning Google user and a local account with the
+            # same email; the google_id match takes precedence
+            candidates = db.session.scalars(select(User).where(or_(
+                User.google_id == user_info['sub'], User.email == user_info['email']
+            ))).all()
+            user = next((u for u in candidates if u.google_id == user_info['sub']), None)
             
             if not user:
                 # Check if user with same email exists (local account)
-                existing_user = User.query.filter_by(email=user_info['email']).first()
+                existing_user = next((u for u in candidates if u.email == user_info['email']), None)
                 if existing_user:
                     # Link Google account to existing local account
                     existing_user.google_id = user_info['sub']
                     existing_user.profile_picture = user_info.get('picture')
                     existing_user.auth_provider = 'google'
-                    db.session.commit()
                     user = existing_user
                 else:
                     # Create new user
@@ -273,28 +351,23 @@ def google_callback():
                         role='provider'  # Default role for new Google users
                     )
                     db.session.add(user)
-                    db.session.commit()
+                    db.session.flush()  # Assign the ID for the session
             
-            # Store user info in the session with explicit permanence
-            session.permanent = True
-            session['user_id'] = user.id
-            session['user_role'] = user.role
-            session['user_name'] = f"{user.first_name} {user.last_name}"
+            # Capture the identity before committing; touching user attributes after the
+            # commit would expire them and cost a refresh SELECT. The session is only
+            # started once the account (and its id) is actually committed.
+            identity = _session_identity(user)
+            db.session.commit()
+            _start_session(*identity)
             flash('Google login successful!', 'success')
 
             # Create response and redirect to appropriate dashboard
-            if user.role == 'admin':
-                response = redirect(url_for('admin_dashboard'))
-            elif user.role == 'reviewer':
-                response = redirect(url_for('reviewer_dashboard'))
-            else:
-                response = redirect(url_for('provider_dashboard'))
+            response = redirect_to_dashboard(session['user_role'])
             
             # Only set fallback cookie in development mode with explicit flag (SECURITY)
-            enable_fallback = os.environ.get('ENABLE_WEBVIEW_FALLBACK', 'false').lower() == 'true'
-            if enable_fallback and not is_production:
+            if WEBVIEW_FALLBACK_ENABLED:
                 response.set_cookie('voicescript_session', 
-                                  value=f"{user.id}:{user.role}:{user.first_name} {user.last_name}",
+                                  value=f"{session['user_id']}:{session['user_role']}:{session['user_name']}",
                                   max_age=3600,
                                   secure=False,
                                   httponly=False,
@@ -306,6 +379,7 @@ def google_callback():
             return redirect(url_for('login'))
                 
     except Exception as e:
+        db.session.rollback()
         flash(f'Google authentication failed: {str(e)}', 'error')
         return redirect(url_for('login'))
 
@@ -322,45 +396,55 @@ def webview_login():
     # If already logged in, redirect to dashboard
     if 'user_id' in session:
         user_role = session.get('user_role', 'provider')
-        if user_role == 'admin':
-            return redirect(url_for('admin_dashboard'))
-        elif user_role == 'reviewer':
-            return redirect(url_for('reviewer_dashboard'))
-        else:
-            return redirect(url_for('provider_dashboard'))
+        return redirect_to_dashboard(user_role)
     
     # Default to provider demo account for webview
     email = request.args.get('email', 'provider@demo.com')
     user = User.query.filter_by(email=email).first()
     
     if user:
-        # Store user info in the session
-        session.clear()  # Clear any old session data
-        session.permanent = True
-        session['user_id'] = user.id
-        session['user_role'] = user.role
-        session['user_name'] = f"{user.first_name} {user.last_name}"
-        session.modified = True
+        _start_session(*_session_identity(user))
         
         app.logger.info(f"Webview login: {email} -> {user.role} (ID: {user.id})")
         
         # Redirect to appropriate dashboard
-        if user.role == 'admin':
-            return redirect(url_for('admin_dashboard'))
-        elif user.role == 'reviewer':
-            return redirect(url_for('reviewer_dashboard'))
-        else:
-            return redirect(url_for('provider_dashboard'))
+        return redirect_to_dashboard(user.role)
     else:
         flash('Authentication failed', 'error')
         return redirect(url_for('login'))
 
 
 
+# Hot dashboard/API statements, built once at import and executed with bound parameters
+USER_STATUS_COUNTS_STMT = (
+    select(Submission.status, db.func.count())
+    .where(Submission.user_id == bindparam('user_id'))
+    .group_by(Submission.status)
+)
+USER_EARNINGS_STMT = (
+    select(db.func.sum(BillingRecord.amount))
+    .where(BillingRecord.user_id == bindparam('user_id'))
+)
+# Platform stats in a single round-trip: FILTER aggregates over submissions
+# plus scalar subqueries for the users and scripts tables
+ADMIN_STATS_STMT = select(
+    select(db.func.count(User.id)).scalar_subquery().label('total_users'),
+    db.func.count(Submission.id).label('total_submissions'),
+    db.func.count(Submission.id).filter(Submission.status == 'pending').label('pending_submissions'),
+    db.func.count(Submission.id).filter(Submission.status == 'approved').label('approved_submissions'),
+    select(db.func.count(Script.id)).scalar_subquery().label('total_scripts'),
+    select(db.func.count(Script.id)).where(Script.is_active == True).scalar_subquery().label('active_scripts')
+).select_from(Submission)
+ACTIVE_LANGUAGES_STMT = (
+    select(Language.code, Language.name, Language.native_name)
+    .where(Language.is_active == True)
+    .order_by(Language.name)
+)
+
 @app.route('/dashboard/provider')
 @require_auth  
 def provider_dashboard():
-    user = User.query.get(session['user_id'])
+    user = current_user_profile()
     if not user:
         flash('User not found', 'error')
         return redirect(url_for('login'))
@@ -368,13 +452,14 @@ def provider_dashboard():
     submissions = Submission.query.filter_by(user_id=user.id).order_by(Submission.created_at.desc()).limit(10).all()
     scripts = Script.query.filter_by(is_active=True).all()
     
-    # Calculate user stats
-    total_submissions = Submission.query.filter_by(user_id=user.id).count()
-    approved_submissions = Submission.query.filter_by(user_id=user.id, status='approved').count()
-    pending_submissions = Submission.query.filter_by(user_id=user.id, status='pending').count()
-    
+    # Calculate user stats in one grouped query instead of a COUNT per status
+    status_counts = dict(db.session.execute(USER_STATUS_COUNTS_STMT, {'user_id': user.id}).all())
+    total_submissions = sum(status_counts.values())
+    approved_submissions = status_counts.get('approved', 0)
+    pending_submissions = status_counts.get('pending', 0)
+
     # Calculate earnings
-    earnings = db.session.query(db.func.sum(BillingRecord.amount)).filter_by(user_id=user.id).scalar() or 0
+    earnings = db.session.execute(USER_EARNINGS_STMT, {'user_id': user.id}).scalar() or 0
     
     stats = {
         'total_submissions': total_submissions,
@@ -393,8 +478,12 @@ def provider_dashboard():
 @app.route('/dashboard/reviewer')
 @require_role(['reviewer', 'admin'])
 def reviewer_dashboard():
-    pending_submissions = Submission.query.filter_by(status='pending').order_by(Submission.created_at.desc()).all()
-    recent_reviews = Submission.query.filter(
+    pending_submissions = Submission.query.options(
+        SUBMISSION_USER_LOADER, SUBMISSION_SCRIPT_LOADER, defer(Submission.transcript)
+    ).filter_by(status='pending').order_by(Submission.created_at.desc()).all()
+    recent_reviews = Submission.query.options(
+        SUBMISSION_USER_LOADER, SUBMISSION_SCRIPT_LOADER, defer(Submission.transcript)
+    ).filter(
         Submission.reviewed_by == session['user_id']
     ).order_by(Submission.reviewed_at.desc()).limit(10).all()
     
@@ -412,15 +501,7 @@ def admin_redirect():
 @app.route('/dashboard/admin')
 @require_role(['admin'])
 def admin_dashboard():
-    # Calculate platform stats
-    stats = {
-        'total_users': User.query.count(),
-        'total_submissions': Submission.query.count(),
-        'pending_submissions': Submission.query.filter_by(status='pending').count(),
-        'approved_submissions': Submission.query.filter_by(status='approved').count(),
-        'total_scripts': Script.query.count(),
-        'active_scripts': Script.query.filter_by(is_active=True).count()
-    }
+    stats = db.session.execute(ADMIN_STATS_STMT).one()._asdict()
     
     recent_activity = Submission.query.order_by(Submission.created_at.desc()).limit(10).all()
     
@@ -428,6 +509,16 @@ def admin_dashboard():
                          stats=stats, 
                          recent_activity=recent_activity)
 
+# Related rows rendered by the submission list templates, each fetched in one extra query
+SUBMISSION_USER_LOADER = selectinload(Submission.user).load_only(User.id, User.first_name, User.last_name, User.email)
+SUBMISSION_SCRIPT_LOADER = selectinload(Submission.script).load_only(Script.id, Script.title)
+
+# Rows per page on /submissions
+SUBMISSIONS_PAGE_SIZE = 50
+
+# Columns needed to list scripts without pulling their full content
+SCRIPT_LIST_COLUMNS = (Script.id, Script.title, Script.language, Script.category, Script.created_at)
+
 # Additional routes for complete functionality  
 @app.route('/record')
 @require_auth
@@ -445,14 +536,15 @@ def record_script(script_id):
     else:
         script = Script.query.get_or_404(script_id)
     
-    scripts = Script.query.filter_by(is_active=True, language=language).order_by(Script.created_at.desc()).all()
+    # Sidebar only needs list columns; the full content is loaded for the selected script alone
+    scripts = db.session.query(*SCRIPT_LIST_COLUMNS).filter_by(is_active=True, language=language).order_by(Script.created_at.desc()).all()
     return render_template('record.html', script=script, scripts=scripts)
 
 @app.route('/record-queue')
 @require_auth
 def record_queue():
     """Streamlined recording interface with auto-advance functionality"""
-    user = User.query.get(session['user_id'])
+    user = current_user_profile()
     if not user:
         flash('User not found', 'error')
         return redirect(url_for('login'))
@@ -467,6 +559,19 @@ def record_queue():
     
     return render_template('record_queue.html', user=user, languages=languages)
 
+# Keyset pagination cursors encode the (created_at, id) of the last row served
+def _encode_cursor(created_at, row_id):
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+def _decode_cursor(cursor):
+    """Return (created_at, id) for a cursor string, or None if it is malformed"""
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|')
+        return datetime.fromisoformat(created_at), int(row_id)
+    except ValueError:
+        return None
+
 # API endpoint to get paginated scripts data
 @app.route('/api/scripts', methods=['GET'])
 @require_auth
@@ -474,11 +579,21 @@ def get_scripts():
     # Get query parameters
     language = request.args.get('language', '')
     search_query = request.args.get('q', '').strip()
-    page = max(1, int(request.args.get('page', 1)))
+    cursor = request.args.get('cursor', '')
     page_size = min(100, max(10, int(request.args.get('page_size', 20))))  # Cap at 100, min 10
     
-    # Build query
-    query = Script.query.filter_by(is_active=True)
+    # Build query - project only the listed columns plus a bounded content preview
+    # so the full content TEXT column is never transferred or hydrated into ORM objects
+    query = db.session.query(
+        Script.id,
+        db.func.coalesce(db.func.nullif(Script.title, ''), 'Script ' + db.cast(Script.id, db.String)).label('title'),
+        db.func.substr(Script.content, 1, 201).label('preview'),
+        Script.language,
+        db.func.coalesce(db.func.nullif(Script.category, ''), 'General').label('category'),
+        db.func.coalesce(db.func.nullif(Script.difficulty, ''), 'Medium').label('difficulty'),
+        Script.target_duration,
+        Script.created_at
+    ).filter(Script.is_active == True)
     
     # Apply language filter if specified
     if language:
@@ -495,28 +610,33 @@ def get_scripts():
             )
         )
     
-    # Order and paginate
-    query = query.order_by(Script.created_at.desc())
-    total = query.count()
-    scripts = query.offset((page - 1) * page_size).limit(page_size).all()
+    # Resume after the last row of the previous page (keyset pagination)
+    if cursor:
+        position = _decode_cursor(cursor)
+        if position is None:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        query = query.filter(db.tuple_(Script.created_at, Script.id) < position)
     
-    # Calculate pagination info
-    has_next = total > page * page_size
+    # Fetch one extra row to learn whether another page exists without a COUNT(*)
+    query = query.order_by(Script.created_at.desc(), Script.id.desc())
+    rows = query.limit(page_size + 1).all()
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].id) if has_next else None
     
     return jsonify({
         'items': [{
-            'id': script.id,
-            'title': getattr(script, 'title', None) or f"Script {script.id}",
-            'content': script.content[:200] + '...' if len(script.content) > 200 else script.content,  # Preview only
-            'language': script.language,
-            'category': getattr(script, 'category', None) or 'General',
-            'difficulty': getattr(script, 'difficulty', None) or 'Medium',
-            'target_duration': getattr(script, 'target_duration', None)
-        } for script in scripts],
-        'page': page,
+            'id': row.id,
+            'title': row.title,
+            'content': row.preview[:200] + '...' if len(row.preview) > 200 else row.preview,  # Preview only
+            'language': row.language,
+            'category': row.category,
+            'difficulty': row.difficulty,
+            'target_duration': row.target_duration
+        } for row in rows],
         'page_size': page_size,
-        'total': total,
-        'has_next': has_next
+        'has_next': has_next,
+        'next_cursor': next_cursor
     })
 
 # API endpoint to get individual script details for users
@@ -541,12 +661,33 @@ def get_script_details(script_id):
 @app.route('/api/languages', methods=['GET'])
 @require_auth
 def get_languages():
-    languages = Language.query.filter_by(is_active=True).order_by(Language.name).all()
-    return jsonify([{
-        'code': lang.code,
-        'name': lang.name,
-        'native_name': lang.native_name
-    } for lang in languages])
+    return jsonify(cached(ACTIVE_LANGUAGES_CACHE_KEY, LANGUAGES_CACHE_TTL, _load_active_languages))
+
+def _load_active_languages():
+    return [row._asdict() for row in db.session.execute(ACTIVE_LANGUAGES_STMT)]
+
+def _languages_by_code():
+    """Return {code: language details} for every language, active or not, from the cache"""
+    return cached(LANGUAGES_BY_CODE_CACHE_KEY, LANGUAGES_CACHE_TTL, lambda: {
+        row.code: row._asdict() for row in db.session.query(
+            Language.code, Language.name, Language.native_name, Language.is_active
+        )
+    })
+
+def _language_exists(code):
+    """Check a language code against the cached languages"""
+    return code in _languages_by_code()
+
+def _pricing_rates():
+    """Return {language_code: pricing row} from the cache, for display only; billing reads the table"""
+    return cached(PRICING_CACHE_KEY, PRICING_CACHE_TTL, lambda: {
+        row.language_code: row for row in db.session.query(
+            PricingRate.language_code,
+            PricingRate.provider_rate_per_word,
+            PricingRate.reviewer_rate_per_submission,
+            PricingRate.currency
+        )
+    })
 
 # Removed custom content route - only script-based recordings allowed
 
@@ -554,11 +695,29 @@ def get_languages():
 @require_auth
 def submissions():
     # Admins see ALL submissions, regular users see only their own
-    if session.get('user_role') == 'admin':
-        user_submissions = Submission.query.order_by(Submission.created_at.desc()).all()
-    else:
-        user_submissions = Submission.query.filter_by(user_id=session['user_id']).order_by(Submission.created_at.desc()).all()
-    return render_template('submissions.html', submissions=user_submissions)
+    cursor = request.args.get('cursor', '')
+    query = Submission.query.options(
+        SUBMISSION_SCRIPT_LOADER,
+        load_only(Submission.id, Submission.script_id, Submission.audio_filename,
+                  Submission.transcript, Submission.status, Submission.created_at)
+    )
+    if session.get('user_role') != 'admin':
+        query = query.filter_by(user_id=session['user_id'])
+    
+    # Resume after the last row of the previous page (keyset pagination)
+    if cursor:
+        position = _decode_cursor(cursor)
+        if position is None:
+            abort(400)
+        query = query.filter(db.tuple_(Submission.created_at, Submission.id) < position)
+    
+    rows = query.order_by(Submission.created_at.desc(), Submission.id.desc()).limit(SUBMISSIONS_PAGE_SIZE + 1).all()
+    user_submissions = rows[:SUBMISSIONS_PAGE_SIZE]
+    next_cursor = None
+    if len(rows) > SUBMISSIONS_PAGE_SIZE:
+        next_cursor = _encode_cursor(user_submissions[-1].created_at, user_submissions[-1].id)
+    return render_template('submissions.html', submissions=user_submissions,
+                           next_cursor=next_cursor, is_first_page=not cursor)
 
 @app.route('/submissions/<int:submission_id>/update-transcript', methods=['POST'])
 @require_auth
@@ -585,7 +744,9 @@ def update_transcript(submission_id):
 @app.route('/reviews')
 @require_role(['reviewer', 'admin'])
 def reviews():
-    pending_submissions = Submission.query.filter_by(status='pending').order_by(Submission.created_at.asc()).all()
+    pending_submissions = Submission.query.options(
+        SUBMISSION_USER_LOADER, SUBMISSION_SCRIPT_LOADER, defer(Submission.transcript)
+    ).filter_by(status='pending').order_by(Submission.created_at.asc()).all()
     return render_template('reviews.html', submissions=pending_submissions)
 
 @app.route('/admin/languages')
@@ -610,49 +771,26 @@ def admin_scripts():
     return render_template('admin_scripts.html', scripts=scripts, languages=languages)
 
 # Recording and submission routes
-@app.route('/submit_recording', methods=['POST'])
-@require_auth
-def submit_recording():
-    script_id = request.form.get('script_id')
-    language_id = request.form.get('language_id')
-    text_content = request.form.get('text_content', '').strip()
-    transcript = request.form.get('transcript', '').strip()
-    audio_file = request.files.get('audio_file')
-    
-    # Validate required fields - for script-based recordings, audio and language are mandatory
-    if not script_id:
-        return jsonify({'success': False, 'error': 'Script selection is required'}), 400
-    
-    if not language_id:
-        return jsonify({'success': False, 'error': 'Language selection is required'}), 400
-    
-    if not audio_file or not audio_file.filename:
-        return jsonify({'success': False, 'error': 'Audio recording is required for script submissions'}), 400
-    
-    # Handle audio file if uploaded
-    audio_filename = None
-    duration = None
-    if audio_file and audio_file.filename:
-        filename = secure_filename(audio_file.filename)
-        # Generate unique filename to prevent conflicts
-        audio_filename = f"{uuid.uuid4()}_{filename}"
-        
-        # Ensure upload directory exists
-        os.makedirs(app.config.get('UPLOAD_FOLDER', 'uploads'), exist_ok=True)
-        audio_file.save(os.path.join(app.config.get('UPLOAD_FOLDER', 'uploads'), audio_filename))
-    
+def _new_audio_filename(client_filename):
+    """Return a unique name for a stored recording, keeping the client's extension if it is allowed"""
+    client_filename = client_filename or ''
+    ext = client_filename.rsplit('.', 1)[-1].lower() if '.' in client_filename else ''
+    if ext not in ALLOWED_AUDIO_EXTENSIONS:
+        ext = 'webm'
+    return f"{uuid.uuid4().hex}.{ext}"
+
+def _create_recording_submission(script_id, language_id, text_content, transcript, audio_filename, duration=None):
+    """Persist a provider recording whose audio is already on disk and return the JSON response"""
     # Calculate word count - use script content if no text_content provided
     word_count = 0
     if text_content:
-        word_count = len(text_content.split())
+        word_count = count_words(text_content)
     elif script_id:
         # If recording from a script but no text provided, use script word count
-        script = Script.query.get(int(script_id))
-        if script and script.content:
-            word_count = len(script.content.split())
+        word_count = db.session.query(Script.word_count).filter_by(id=int(script_id)).scalar() or 0
     
     # Get user for demographic snapshot
-    user = User.query.get(session['user_id'])
+    user = current_user_profile()
     
     # Create new submission with demographic snapshot
     try:
@@ -683,6 +821,61 @@ def submit_recording():
         app.logger.error(f'Traceback: {traceback.format_exc()}')
         return jsonify({'success': False, 'error': 'Failed to save recording. Please try again.'}), 500
 
+@app.route('/submit_recording', methods=['POST'])
+@require_auth
+def submit_recording():
+    script_id = request.form.get('script_id')
+    language_id = request.form.get('language_id')
+    text_content = request.form.get('text_content', '').strip()
+    transcript = request.form.get('transcript', '').strip()
+    audio_file = request.files.get('audio_file')
+    
+    # Validate required fields - for script-based recordings, audio and language are mandatory
+    if not script_id:
+        return jsonify({'success': False, 'error': 'Script selection is required'}), 400
+    
+    if not language_id:
+        return jsonify({'success': False, 'error': 'Language selection is required'}), 400
+    
+    if not audio_file or not audio_file.filename:
+        return jsonify({'success': False, 'error': 'Audio recording is required for script submissions'}), 400
+    
+    # Handle audio file if uploaded
+    audio_filename = None
+    if audio_file and audio_file.filename:
+        audio_filename = _new_audio_filename(audio_file.filename)
+        audio_file.save(os.path.join(UPLOAD_FOLDER, audio_filename), buffer_size=UPLOAD_CHUNK_SIZE)
+    
+    return _create_recording_submission(script_id, language_id, text_content, transcript, audio_filename)
+
+@app.route('/submit_recording_stream', methods=['POST'])
+@require_auth
+def submit_recording_stream():
+    """Accept the recording as a raw request body and stream it straight to disk.
+    
+    Metadata travels in the query string, so the body never goes through
+    Werkzeug's multipart parser.
+    """
+    script_id = request.args.get('script_id')
+    language_id = request.args.get('language_id')
+    text_content = request.args.get('text_content', '').strip()
+    transcript = request.args.get('transcript', '').strip()
+    
+    if not script_id:
+        return jsonify({'success': False, 'error': 'Script selection is required'}), 400
+    
+    if not language_id:
+        return jsonify({'success': False, 'error': 'Language selection is required'}), 400
+    
+    if not request.content_length:
+        return jsonify({'success': False, 'error': 'Audio recording is required for script submissions'}), 400
+    
+    audio_filename = _new_audio_filename(request.args.get('filename', 'recording.webm'))
+    with open(os.path.join(UPLOAD_FOLDER, audio_filename), 'wb') as f:
+        shutil.copyfileobj(request.stream, f, UPLOAD_CHUNK_SIZE)
+    
+    return _create_recording_submission(script_id, language_id, text_content, transcript, audio_filename)
+
 # Field Collection Routes for Admins
 @app.route('/admin/field-collect')
 @require_role(['admin'])
@@ -691,21 +884,21 @@ def admin_field_collect():
     languages = Language.query.filter_by(is_active=True).all()
     return render_template('admin_field_collect.html', languages=languages)
 
-@app.route('/admin/field-collect/submit', methods=['POST'])
-@require_role(['admin'])
-def submit_field_collection():
-    """Handle field-collected recording submissions by admins"""
-    script_id = request.form.get('script_id')
-    language_id = request.form.get('language_id')
-    audio_file = request.files.get('audio_file')
+def _create_field_submission(params, client_filename, write_audio):
+    """Validate field-collection metadata, store the audio via write_audio(path) and create the submission
+    
+    params is request.form for multipart uploads or request.args for raw-body uploads.
+    """
+    script_id = params.get('script_id')
+    language_id = params.get('language_id')
     
     # Speaker metadata
-    speaker_name = request.form.get('speaker_name', '').strip()
-    speaker_location = request.form.get('speaker_location', '').strip()
-    transcript = request.form.get('transcript', '').strip()
-    transcript_language_id = request.form.get('transcript_language_id')  # Language of the transcript text
-    provider_gender = request.form.get('provider_gender')
-    provider_age_group = request.form.get('provider_age_group')
+    speaker_name = params.get('speaker_name', '').strip()
+    speaker_location = params.get('speaker_location', '').strip()
+    transcript = params.get('transcript', '').strip()
+    transcript_language_id = params.get('transcript_language_id')  # Language of the transcript text
+    provider_gender = params.get('provider_gender')
+    provider_age_group = params.get('provider_age_group')
     
     # Validate required fields
     if not script_id:
@@ -714,25 +907,18 @@ def submit_field_collection():
     if not language_id:
         return jsonify({'success': False, 'message': 'Language selection is required'}), 400
     
-    if not audio_file or not audio_file.filename:
+    if not client_filename:
         return jsonify({'success': False, 'message': 'Audio recording is required'}), 400
     
     if not provider_gender or not provider_age_group:
         return jsonify({'success': False, 'message': 'Speaker gender and age group are required'}), 400
     
     # Handle audio file upload
-    filename = secure_filename(audio_file.filename)
-    audio_filename = f"{uuid.uuid4()}_{filename}"
-    
-    upload_folder = app.config.get('UPLOAD_FOLDER', 'uploads')
-    os.makedirs(upload_folder, exist_ok=True)
-    audio_file.save(os.path.join(upload_folder, audio_filename))
+    audio_filename = _new_audio_filename(client_filename)
+    write_audio(os.path.join(UPLOAD_FOLDER, audio_filename))
     
     # Calculate word count from script
-    word_count = 0
-    script = Script.query.get(int(script_id))
-    if script and script.content:
-        word_count = len(script.content.split())
+    word_count = db.session.query(Script.word_count).filter_by(id=int(script_id)).scalar() or 0
     
     # Create field-collected submission (auto-approved, no review needed)
     submission = Submission(
@@ -754,47 +940,84 @@ def submit_field_collection():
     )
     
     db.session.add(submission)
+    db.session.flush()  # Read the ID before commit expires the instance
+    submission_id = submission.id
     db.session.commit()
     
     return jsonify({
         'success': True, 
         'message': 'Recording submitted successfully!',
-        'submission_id': submission.id
+        'submission_id': submission_id
     })
 
+@app.route('/admin/field-collect/submit', methods=['POST'])
+@require_role(['admin'])
+def submit_field_collection():
+    """Handle field-collected recording submissions by admins"""
+    audio_file = request.files.get('audio_file')
+    return _create_field_submission(
+        request.form,
+        audio_file.filename if audio_file else None,
+        lambda path: audio_file.save(path, buffer_size=UPLOAD_CHUNK_SIZE)
+    )
+
+@app.route('/admin/field-collect/submit_stream', methods=['POST'])
+@require_role(['admin'])
+def submit_field_collection_stream():
+    """Accept a field recording as a raw application/octet-stream body and stream it to disk.
+    
+    Takes the same fields as the multipart route, plus filename, in the query string,
+    so large recordings skip Werkzeug's multipart parser and its temporary spool file.
+    """
+    def write_audio(path):
+        with open(path, 'wb') as f:
+            shutil.copyfileobj(request.stream, f, UPLOAD_CHUNK_SIZE)
+    
+    client_filename = request.args.get('filename', 'recording.webm') if request.content_length else None
+    return _create_field_submission(request.args, client_filename, write_audio)
+
 # File serving route for audio files
 @app.route('/uploads/<filename>')
 @require_auth
 def uploaded_file(filename):
     """Serve uploaded audio files"""
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    return send_from_directory(UPLOAD_FOLDER, filename)
 
 # Delete submission route for providers
 @app.route('/delete_submission/<int:submission_id>', methods=['POST'])
 @require_auth
 def delete_submission(submission_id):
     """Allow providers to delete their own submissions before review"""
-    submission = Submission.query.get_or_404(submission_id)
-    
-    # Check if user owns this submission
-    if submission.user_id != session['user_id']:
-        flash('You can only delete your own submissions.', 'error')
+    # Ownership and pending status are part of the DELETE itself, so a review
+    # landing between the check and the delete cannot be lost
+    audio_filename = db.session.execute(
+        delete(Submission).where(
+            Submission.id == submission_id,
+            Submission.user_id == session['user_id'],
+            Submission.status == 'pending'
+        ).returning(Submission.audio_filename)
+    ).scalar_one_or_none()
+    
+    if audio_filename is None:
+        db.session.rollback()
+        existing = db.session.query(Submission.user_id).filter(Submission.id == submission_id).first()
+        if existing is None:
+            abort(404)
+        
+        # Check if user owns this submission
+        if existing.user_id != session['user_id']:
+            flash('You can only delete your own submissions.', 'error')
+        else:
+            flash('You can only delete submissions that haven\'t been reviewed yet.', 'error')
         return redirect(url_for('provider_dashboard'))
     
-    # Check if submission is still pending (not reviewed)
-    if submission.status != 'pending':
-        flash('You can only delete submissions that haven\'t been reviewed yet.', 'error')
-        return redirect(url_for('provider_dashboard'))
+    db.session.commit()
     
     # Delete audio file if it exists
-    if submission.audio_filename:
-        audio_path = os.path.join(app.config['UPLOAD_FOLDER'], submission.audio_filename)
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
-    
-    # Delete submission from database
-    db.session.delete(submission)
-    db.session.commit()
+    try:
+        os.unlink(os.path.join(UPLOAD_FOLDER, audio_filename))
+    except FileNotFoundError:
+        pass
     
     flash('Submission deleted successfully.', 'success')
     return redirect(url_for('provider_dashboard'))
@@ -835,60 +1058,86 @@ def process_review(submission_id):
         review_notes = data.get('notes', '')
         quality_score = data.get('quality_score', 0)
         
-        # Update submission
-        submission.status = action if action in ['approved', 'rejected'] else 'pending'
-        submission.reviewed_by = session['user_id']
-        submission.reviewed_at = datetime.utcnow()
-        submission.review_notes = review_notes
-        submission.quality_score = quality_score
-        
-        # Create billing records for approved submissions
-        if action == 'approved':
-            # Get language-specific pricing
-            script_language = submission.script.language if submission.script else 'en'
-            pricing = PricingRate.query.filter_by(language_code=script_language).first()
-            
-            if not pricing:
-                # Create default pricing if none exists
-                pricing = PricingRate(
-                    language_code=script_language,
-                    provider_rate_per_word=0.01,
-                    reviewer_rate_per_submission=2.00
-                )
-                db.session.add(pricing)
-                db.session.flush()  # Get the ID
-            
-            # Provider payment (per word) - recalculate word count if needed
-            provider_word_count = submission.word_count
-            if provider_word_count == 0 and submission.script:
-                # Use script word count if submission word count is 0
-                provider_word_count = len(submission.script.content.split())
-            
-            if provider_word_count > 0:
-                provider_amount = provider_word_count * pricing.provider_rate_per_word
-                provider_billing = BillingRecord(
-                    user_id=submission.user_id,
-                    submission_id=submission.id,
-                    amount=provider_amount,
-                    rate_per_word=pricing.provider_rate_per_word,
-                    billing_type='provider',
-                    language_code=script_language,
-                    word_count=provider_word_count
-                )
-                db.session.add(provider_billing)
+        try:
+            # Hold every write until the commit so the submission update and billing
+            # rows go out together instead of flushing whenever a lazy load fires
+            with db.session.no_autoflush:
+                # Update submission
+                submission.status = action if action in ['approved', 'rejected'] else 'pending'
+                submission.reviewed_by = session['user_id']
+                submission.reviewed_at = datetime.utcnow()
+                submission.review_notes = review_notes
+                submission.quality_score = quality_score
+                
+                # Create billing records for approved submissions
+                created_pricing = False
+                if action == 'approved':
+                    # Billing only needs the script's language and word count, not its content
+                    script = db.session.query(Script.language, Script.word_count).filter(
+                        Script.id == submission.script_id
+                    ).first() if submission.script_id else None
+                    
+                    # Get language-specific pricing straight from the table; payouts must not
+                    # use a rate another worker's cache hasn't seen updated yet
+                    script_language = script.language if script else 'en'
+                    rates_stmt = select(
+                        PricingRate.provider_rate_per_word,
+                        PricingRate.reviewer_rate_per_submission
+                    ).where(PricingRate.language_code == script_language)
+                    rates = db.session.execute(rates_stmt).first()
+                    
+                    if rates is None:
+                        # Create default pricing if none exists; if a concurrent approval
+                        # just created it, keep that row and bill at whatever it holds
+                        insert = UPSERT_INSERTS[db.session.get_bind().dialect.name]
+                        db.session.execute(insert(PricingRate).values(
+                            language_code=script_language,
+                            provider_rate_per_word=0.01,
+                            reviewer_rate_per_submission=2.00
+                        ).on_conflict_do_nothing())
+                        created_pricing = True
+                        rates = db.session.execute(rates_stmt).first()
+                    provider_rate, reviewer_rate = rates.provider_rate_per_word, rates.reviewer_rate_per_submission
+                    
+                    # Provider payment (per word) - recalculate word count if needed
+                    provider_word_count = submission.word_count
+                    if provider_word_count == 0 and script:
+                        # Use script word count if submission word count is 0
+                        provider_word_count = script.word_count
+                    
+                    if provider_word_count > 0:
+                        provider_amount = provider_word_count * provider_rate
+                        provider_billing = BillingRecord(
+                            user_id=submission.user_id,
+                            submission_id=submission.id,
+                            amount=provider_amount,
+                            rate_per_word=provider_rate,
+                            billing_type='provider',
+                            language_code=script_language,
+                            word_count=provider_word_count
+                        )
+                        db.session.add(provider_billing)
+                    
+                    # Reviewer payment (per submission)
+                    reviewer_billing = BillingRecord(
+                        user_id=session['user_id'],  # Current reviewer
+                        submission_id=submission.id,
+                        amount=reviewer_rate,
+                        rate_per_submission=reviewer_rate,
+                        billing_type='reviewer',
+                        language_code=script_language
+                    )
+                    db.session.add(reviewer_billing)
+                    
             
-            # Reviewer payment (per submission)
-            reviewer_billing = BillingRecord(
-                user_id=session['user_id'],  # Current reviewer
-                submission_id=submission.id,
-                amount=pricing.reviewer_rate_per_submission,
-                rate_per_submission=pricing.reviewer_rate_per_submission,
-                billing_type='reviewer',
-                language_code=script_language
-            )
-            db.session.add(reviewer_billing)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Review of submission {submission_id} failed: {e}")
+            return jsonify({'success': False, 'error': 'Failed to save review'}), 500
         
-        db.session.commit()
+        if created_pricing:
+            invalidate_cache(PRICING_CACHE_KEY)
         
         return jsonify({
             'success': True,
@@ -900,7 +1149,7 @@ def process_review(submission_id):
 @require_role(['admin'])
 def admin_pricing():
     """Admin interface for managing pricing rates"""
-    languages = Language.query.filter_by(is_active=True).all()
+    languages = cached(ACTIVE_LANGUAGES_CACHE_KEY, LANGUAGES_CACHE_TTL, _load_active_languages)
     pricing_rates = PricingRate.query.all()
     
     # Create dict for easy lookup
@@ -920,23 +1169,25 @@ def update_pricing():
     reviewer_rate = float(data.get('reviewer_rate', 2.00))
     currency = data.get('currency', 'USD')
     
-    # Find or create pricing record
-    pricing = PricingRate.query.filter_by(language_code=language_code).first()
-    if pricing:
-        pricing.provider_rate_per_word = provider_rate
-        pricing.reviewer_rate_per_submission = reviewer_rate
-        pricing.currency = currency
-        pricing.updated_at = datetime.utcnow()
-    else:
-        pricing = PricingRate(
-            language_code=language_code,
-            provider_rate_per_word=provider_rate,
-            reviewer_rate_per_submission=reviewer_rate,
-            currency=currency
+    rates = {
+        'provider_rate_per_word': provider_rate,
+        'reviewer_rate_per_submission': reviewer_rate,
+        'currency': currency
+    }
+    # Update the language's pricing row in place, creating it only if there is none;
+    # the unique language_code index turns a concurrent create into a no-op
+    updated = db.session.execute(
+        update(PricingRate).where(PricingRate.language_code == language_code)
+        .values(updated_at=datetime.utcnow(), **rates)
+    )
+    if updated.rowcount == 0:
+        insert = UPSERT_INSERTS[db.session.get_bind().dialect.name]
+        db.session.execute(
+            insert(PricingRate).values(language_code=language_code, **rates).on_conflict_do_nothing()
         )
-        db.session.add(pricing)
     
     db.session.commit()
+    invalidate_cache(PRICING_CACHE_KEY)
     return jsonify({'success': True})
 
 # Earnings dashboard routes  
@@ -949,38 +1200,47 @@ def earnings_dashboard():
         flash('Earnings functionality is currently disabled.', 'info')
         # Redirect to appropriate dashboard based on user role
         user_role = session.get('user_role', 'provider')
-        if user_role == 'admin':
-            return redirect(url_for('admin_dashboard'))
-        elif user_role == 'reviewer':
-            return redirect(url_for('reviewer_dashboard'))
-        else:
-            return redirect(url_for('provider_dashboard'))
+        return redirect_to_dashboard(user_role)
     
     user_id = session['user_id']
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
     if not user:
         flash('User not found', 'error')
         return redirect(url_for('login'))
     
-    # Get user's billing records (handle potential schema migration)
+    # Totals and payment counts are aggregated in SQL; only the most recent
+    # records are loaded for the tables (handle potential schema migration)
     try:
+        totals = {
+            row.billing_type: row for row in db.session.query(
+                BillingRecord.billing_type,
+                db.func.sum(BillingRecord.amount).label('amount'),
+                db.func.count().label('count')
+            ).filter(
+                BillingRecord.user_id == user_id,
+                BillingRecord.billing_type.in_(['provider', 'reviewer'])
+            ).group_by(BillingRecord.billing_type)
+        }
+        
         provider_earnings = BillingRecord.query.filter_by(
             user_id=user_id, 
             billing_type='provider'
-        ).order_by(BillingRecord.created_at.desc()).all()
+        ).order_by(BillingRecord.created_at.desc()).limit(EARNINGS_RECENT_LIMIT).all()
         
         reviewer_earnings = BillingRecord.query.filter_by(
             user_id=user_id, 
             billing_type='reviewer'
-        ).order_by(BillingRecord.created_at.desc()).all()
+        ).order_by(BillingRecord.created_at.desc()).limit(EARNINGS_RECENT_LIMIT).all()
     except Exception as e:
         # Handle old schema - show empty for now
+        db.session.rollback()
+        totals = {}
         provider_earnings = []
         reviewer_earnings = []
     
     # Calculate totals
-    total_provider = sum(record.amount for record in provider_earnings)
-    total_reviewer = sum(record.amount for record in reviewer_earnings)
+    total_provider = totals['provider'].amount if 'provider' in totals else 0
+    total_reviewer = totals['reviewer'].amount if 'reviewer' in totals else 0
     
     # Role-specific total earnings
     if user.role == 'provider':
@@ -994,6 +1254,8 @@ def earnings_dashboard():
                          user=user,
                          provider_earnings=provider_earnings,
                          reviewer_earnings=reviewer_earnings,
+                         provider_count=totals['provider'].count if 'provider' in totals else 0,
+                         reviewer_count=totals['reviewer'].count if 'reviewer' in totals else 0,
                          total_provider=total_provider,
                          total_reviewer=total_reviewer,
                          total_earnings=total_earnings,
@@ -1033,20 +1295,31 @@ def get_script(script_id):
 @require_role(['admin'])
 def get_script_submissions(script_id):
     """Get all submissions for a specific script"""
-    script = Script.query.get_or_404(script_id)
+    script = db.session.query(Script.id, Script.content, Script.language).filter(Script.id == script_id).first()
+    if script is None:
+        abort(404)
     
-    submissions = Submission.query.filter_by(script_id=script_id).order_by(Submission.created_at.desc()).all()
+    # Submitter and collecting admin names come from two outer joins instead of a lookup per row
+    provider = aliased(User)
+    admin = aliased(User)
+    rows = db.session.query(
+        Submission.id, Submission.speaker_name, Submission.speaker_location,
+        Submission.provider_gender, Submission.provider_age_group, Submission.status,
+        Submission.audio_filename, Submission.is_field_collection, Submission.created_at,
+        provider.first_name.label('provider_first_name'), provider.last_name.label('provider_last_name'),
+        admin.first_name.label('admin_first_name'), admin.last_name.label('admin_last_name')
+    ).outerjoin(provider, Submission.user_id == provider.id).outerjoin(
+        admin, Submission.collected_by_admin_id == admin.id
+    ).filter(Submission.script_id == script_id).order_by(Submission.created_at.desc()).all()
     
     result = []
-    for sub in submissions:
+    for sub in rows:
         # Get submitter info
         if sub.is_field_collection:
-            admin = User.query.get(sub.collected_by_admin_id) if sub.collected_by_admin_id else None
-            admin_name = f"{admin.first_name} {admin.last_name}" if admin else 'Unknown'
+            admin_name = f"{sub.admin_first_name} {sub.admin_last_name}" if sub.admin_first_name is not None else 'Unknown'
             submitter_name = f"Field: {sub.speaker_name or 'Anonymous'} (collected by {admin_name})"
         else:
-            user = User.query.get(sub.user_id) if sub.user_id else None
-            submitter_name = f"{user.first_name} {user.last_name}" if user else 'Unknown User'
+            submitter_name = f"{sub.provider_first_name} {sub.provider_last_name}" if sub.provider_first_name is not None else 'Unknown User'
         
         result.append({
             'id': sub.id,
@@ -1083,37 +1356,68 @@ def update_script(script_id):
     db.session.commit()
     return jsonify({'success': True})
 
+def _delete_scripts_with_submissions(script_ids):
+    """Delete scripts, their submissions and requirements with set-based statements and commit.
+    
+    Returns (deleted_scripts, deleted_submissions, audio_filenames) so the caller can
+    remove the audio files once the rows are gone.
+    """
+    audio_filenames = [filename for (filename,) in db.session.query(Submission.audio_filename).filter(
+        Submission.script_id.in_(script_ids), Submission.audio_filename.isnot(None)
+    )]
+    submission_ids = select(Submission.id).where(Submission.script_id.in_(script_ids))
+    no_sync = {'synchronize_session': False}
+    
+    # Mirror the schema's ON DELETE actions explicitly so SQLite dev databases match PostgreSQL
+    db.session.execute(
+        update(BillingRecord).where(BillingRecord.submission_id.in_(submission_ids)).values(submission_id=None),
+        execution_options=no_sync
+    )
+    deleted_submissions = db.session.execute(
+        delete(Submission).where(Submission.script_id.in_(script_ids)), execution_options=no_sync
+    ).rowcount
+    db.session.execute(
+        delete(ScriptVariantRequirement).where(ScriptVariantRequirement.script_id.in_(script_ids)),
+        execution_options=no_sync
+    )
+    deleted_scripts = db.session.execute(
+        delete(Script).where(Script.id.in_(script_ids)), execution_options=no_sync
+    ).rowcount
+    db.session.commit()
+    
+    return deleted_scripts, deleted_submissions, audio_filenames
+
+def _remove_audio_files(audio_filenames):
+    """Delete uploaded audio files in parallel and return how many were removed"""
+    def remove(filename):
+        audio_path = os.path.join(UPLOAD_FOLDER, filename)
+        try:
+            os.unlink(audio_path)
+            return True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            app.logger.error(f"Failed to delete audio file {audio_path}: {e}")
+        return False
+    
+    if not audio_filenames:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(AUDIO_DELETE_WORKERS, len(audio_filenames))) as executor:
+        return sum(executor.map(remove, audio_filenames))
+
 @app.route('/api/scripts/<int:script_id>', methods=['DELETE'])
 @require_role(['admin'])
 def delete_script(script_id):
-    script = Script.query.get_or_404(script_id)
-    
-    # Get all submissions for this script
-    submissions = Submission.query.filter_by(script_id=script_id).all()
+    Script.query.get_or_404(script_id)
     
-    # Delete audio files and submissions
-    deleted_files = 0
-    for submission in submissions:
-        if submission.audio_filename:
-            audio_path = os.path.join(app.config['UPLOAD_FOLDER'], submission.audio_filename)
-            if os.path.exists(audio_path):
-                try:
-                    os.remove(audio_path)
-                    deleted_files += 1
-                except Exception as e:
-                    app.logger.error(f"Failed to delete audio file {audio_path}: {e}")
-        
-        # Delete the submission record
-        db.session.delete(submission)
+    # Delete the script and its submissions, then their audio files
+    _, deleted_submissions, audio_filenames = _delete_scripts_with_submissions([script_id])
+    deleted_files = _remove_audio_files(audio_filenames)
     
-    # Delete the script
-    db.session.delete(script)
-    db.session.commit()
-    
-    app.logger.info(f"Deleted script {script_id} with {len(submissions)} submissions and {deleted_files} audio files")
+    app.logger.info(f"Deleted script {script_id} with {deleted_submissions} submissions and {deleted_files} audio files")
     return jsonify({
         'success': True,
-        'deleted_submissions': len(submissions),
+        'deleted_submissions': deleted_submissions,
         'deleted_files': deleted_files
     })
 
@@ -1132,38 +1436,9 @@ def bulk_delete_scripts():
     except ValueError:
         return jsonify({'success': False, 'error': 'Invalid script ID format'}), 400
     
-    # Delete scripts and their associated submissions
-    total_deleted_scripts = 0
-    total_deleted_submissions = 0
-    total_deleted_files = 0
-    
-    for script_id in script_ids:
-        script = Script.query.get(script_id)
-        if not script:
-            continue
-        
-        # Get all submissions for this script
-        submissions = Submission.query.filter_by(script_id=script_id).all()
-        
-        # Delete audio files and submissions
-        for submission in submissions:
-            if submission.audio_filename:
-                audio_path = os.path.join(app.config['UPLOAD_FOLDER'], submission.audio_filename)
-                if os.path.exists(audio_path):
-                    try:
-                        os.remove(audio_path)
-                        total_deleted_files += 1
-                    except Exception as e:
-                        app.logger.error(f"Failed to delete audio file {audio_path}: {e}")
-            
-            db.session.delete(submission)
-            total_deleted_submissions += 1
-        
-        # Delete the script
-        db.session.delete(script)
-        total_deleted_scripts += 1
-    
-    db.session.commit()
+    # Delete scripts and their associated submissions, then their audio files
+    total_deleted_scripts, total_deleted_submissions, audio_filenames = _delete_scripts_with_submissions(script_ids)
+    total_deleted_files = _remove_audio_files(audio_filenames)
     
     app.logger.info(f"Bulk deleted {total_deleted_scripts} scripts with {total_deleted_submissions} submissions and {total_deleted_files} audio files")
     return jsonify({
@@ -1173,6 +1448,33 @@ def bulk_delete_scripts():
         'deleted_files': total_deleted_files
     })
 
+# Rows per INSERT batch when bulk-adding scripts
+SCRIPT_INSERT_BATCH_SIZE = 5000
+
+def _bulk_insert_scripts(contents, language):
+    """Insert active scripts for a language without per-object unit-of-work tracking"""
+    # Bulk mappings skip the content validator, so word_count is set here
+    mappings = [{
+        'content': content,
+        'language': language,
+        'is_active': True,
+        'word_count': count_words(content)
+    } for content in contents]
+    for start in range(0, len(mappings), SCRIPT_INSERT_BATCH_SIZE):
+        db.session.bulk_insert_mappings(Script, mappings[start:start + SCRIPT_INSERT_BATCH_SIZE])
+
+def _existing_script_contents(contents, language):
+    """Return the subset of contents that already exist as scripts in the given language"""
+    unique_contents = list(set(contents))
+    existing = set()
+    # Batched to stay under database bind-parameter limits for very large uploads
+    for start in range(0, len(unique_contents), SCRIPT_INSERT_BATCH_SIZE):
+        batch = unique_contents[start:start + SCRIPT_INSERT_BATCH_SIZE]
+        existing.update(content for (content,) in db.session.query(Script.content).filter(
+            Script.language == language, Script.content.in_(batch)
+        ))
+    return existing
+
 @app.route('/api/scripts/bulk-upload', methods=['POST'])
 @require_role(['admin'])
 def bulk_upload_scripts():
@@ -1191,16 +1493,15 @@ def bulk_upload_scripts():
             return jsonify({'success': False, 'error': 'Language selection is required'}), 400
         
         # Verify language exists
-        if not Language.query.filter_by(code=language).first():
+        if not _language_exists(language):
             return jsonify({'success': False, 'error': 'Invalid language selected'}), 400
         
         # Read and parse CSV content
         import csv
         import io
         
-        # Read file content
-        content = csv_file.read().decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(content))
+        # Decode the upload as it is parsed rather than reading it into memory first
+        csv_reader = csv.DictReader(io.TextIOWrapper(csv_file.stream, encoding='utf-8', newline=''))
         
         # Validate CSV has required column
         fieldnames = csv_reader.fieldnames or []
@@ -1210,45 +1511,42 @@ def bulk_upload_scripts():
                 'error': 'CSV must have a "content" column. Found columns: ' + ', '.join(fieldnames)
             }), 400
         
-        # Process CSV rows and create scripts
-        created_count = 0
+        # Process CSV rows and collect new scripts
+        candidates = []
         errors = []
         
         for row_num, row in enumerate(csv_reader, start=2):  # Start from 2 because header is row 1
             script_content = row.get('content', '').strip()
             
             if not script_content:
-                errors.append(f"Row {row_num}: Empty content")
+                errors.append((row_num, "Empty content"))
                 continue
             
-            # Check if script with same content and language already exists
-            existing_script = Script.query.filter_by(content=script_content, language=language).first()
-            if existing_script:
-                errors.append(f"Row {row_num}: Script with same content already exists")
+            candidates.append((row_num, script_content))
+        
+        # Check all rows against existing scripts in one lookup, and against earlier rows in this file
+        seen = _existing_script_contents([content for _, content in candidates], language)
+        new_contents = []
+        for row_num, script_content in candidates:
+            if script_content in seen:
+                errors.append((row_num, "Script with same content already exists"))
                 continue
             
-            try:
-                # Create new script
-                script = Script(
-                    content=script_content,
-                    language=language,
-                    is_active=True
-                )
-                db.session.add(script)
-                created_count += 1
-            except Exception as e:
-                errors.append(f"Row {row_num}: Error creating script - {str(e)}")
-                continue
+            seen.add(script_content)
+            new_contents.append(script_content)
         
-        # Commit all changes if at least one script was created
+        # Insert all new scripts in batches and commit once
+        created_count = len(new_contents)
         if created_count > 0:
+            _bulk_insert_scripts(new_contents, language)
             db.session.commit()
         
         # Prepare response
         response_data = {'success': True, 'created_count': created_count}
         
         if errors:
-            response_data['warnings'] = errors
+            # Empty rows and duplicates are found in separate passes; report them in file order
+            response_data['warnings'] = [f"Row {row_num}: {msg}" for row_num, msg in sorted(errors)]
             response_data['message'] = f"Created {created_count} scripts with {len(errors)} warnings"
         
         return jsonify(response_data)
@@ -1277,7 +1575,7 @@ def bulk_add_text_scripts():
             return jsonify({'success': False, 'error': 'Script text is required'}), 400
         
         # Verify language exists
-        if not Language.query.filter_by(code=language).first():
+        if not _language_exists(language):
             return jsonify({'success': False, 'error': 'Invalid language selected'}), 400
         
         # Split text into lines and process each one
@@ -1286,31 +1584,24 @@ def bulk_add_text_scripts():
         if not lines:
             return jsonify({'success': False, 'error': 'No valid script lines found'}), 400
         
-        created_count = 0
+        new_contents = []
         errors = []
         
+        # Existing scripts are fetched in one lookup; earlier lines are added as we go
+        seen = _existing_script_contents(lines, language)
         for line_num, content in enumerate(lines, start=1):
-            # Check for duplicate
-            existing_script = Script.query.filter_by(content=content, language=language).first()
-            if existing_script:
+            # Check for duplicate (in the database or earlier in this text)
+            if content in seen:
                 errors.append(f"Line {line_num}: Script with same content already exists")
                 continue
             
-            # Create script
-            try:
-                script = Script(
-                    content=content,
-                    language=language,
-                    is_active=True
-                )
-                db.session.add(script)
-                created_count += 1
-            except Exception as e:
-                errors.append(f"Line {line_num}: Error creating script - {str(e)}")
-                continue
+            seen.add(content)
+            new_contents.append(content)
         
-        # Commit all changes if at least one script was created
+        # Insert all new scripts in batches and commit once
+        created_count = len(new_contents)
         if created_count > 0:
+            _bulk_insert_scripts(new_contents, language)
             db.session.commit()
         
         response_data = {'success': True, 'created_count': created_count}
@@ -1326,11 +1617,16 @@ def bulk_add_text_scripts():
         return jsonify({'success': False, 'error': f'Failed to process text: {str(e)}'}), 500
 
 # Demographic requirement management APIs
+def _require_script(script_id):
+    """404 unless the script exists, without loading its content"""
+    if db.session.query(Script.id).filter(Script.id == script_id).scalar() is None:
+        abort(404)
+
 @app.route('/api/scripts/<int:script_id>/requirements', methods=['GET'])
 @require_role(['admin'])
 def get_script_requirements(script_id):
     """Get demographic requirements for a script"""
-    script = Script.query.get_or_404(script_id)
+    _require_script(script_id)
     requirements = ScriptVariantRequirement.query.filter_by(script_id=script_id).all()
     
     return jsonify({
@@ -1348,7 +1644,7 @@ def get_script_requirements(script_id):
 @require_role(['admin'])
 def set_script_requirements(script_id):
     """Set demographic requirements for a script"""
-    script = Script.query.get_or_404(script_id)
+    _require_script(script_id)
     data = request.get_json()
     
     requirements = data.get('requirements', [])
@@ -1357,16 +1653,14 @@ def set_script_requirements(script_id):
         # Clear existing requirements
         ScriptVariantRequirement.query.filter_by(script_id=script_id).delete()
         
-        # Add new requirements
-        for req in requirements:
-            variant_req = ScriptVariantRequirement(
-                script_id=script_id,
-                gender=req['gender'],
-                age_group=req['age_group'],
-                target_total=req.get('target_total', 1),
-                enabled=req.get('enabled', True)
-            )
-            db.session.add(variant_req)
+        # Add new requirements in one executemany round trip
+        db.session.bulk_insert_mappings(ScriptVariantRequirement, [{
+            'script_id': script_id,
+            'gender': req['gender'],
+            'age_group': req['age_group'],
+            'target_total': req.get('target_total', 1),
+            'enabled': req.get('enabled', True)
+        } for req in requirements])
         
         db.session.commit()
         return jsonify({'success': True})
@@ -1379,19 +1673,23 @@ def set_script_requirements(script_id):
 @require_role(['admin', 'reviewer'])
 def get_script_progress(script_id):
     """Get progress matrix for a script showing completed vs target by demographic"""
-    script = Script.query.get_or_404(script_id)
+    _require_script(script_id)
     
     # Get requirements
     requirements = ScriptVariantRequirement.query.filter_by(script_id=script_id, enabled=True).all()
     
-    # Get completion counts by demographic
-    from sqlalchemy import func
+    # Get completion counts by demographic; count(*) over indexed columns only,
+    # so PostgreSQL can answer it from idx_submissions_script_progress alone
     completion_counts = db.session.query(
         Submission.provider_gender,
         Submission.provider_age_group,
         Submission.status,
-        func.count(Submission.id).label('count')
-    ).filter_by(script_id=script_id).group_by(
+        db.func.count().label('count')
+    ).filter(
+        Submission.script_id == script_id,
+        Submission.provider_gender.isnot(None),
+        Submission.provider_age_group.isnot(None)
+    ).group_by(
         Submission.provider_gender, 
         Submission.provider_age_group,
         Submission.status
@@ -1432,7 +1730,7 @@ def get_script_progress(script_id):
 @require_auth
 def get_next_recording_task():
     """Get the next script that needs recording for the current user's demographic"""
-    user = User.query.get(session['user_id'])
+    user = current_user_profile()
     if not user:
         return jsonify({'error': 'User not found'}), 404
         
@@ -1442,35 +1740,42 @@ def get_next_recording_task():
         return jsonify({'error': 'User profile incomplete - gender and age group required'}), 400
     
     # Find scripts that need recordings for this user's demographic
-    # and haven't been recorded by this user yet
-    subquery = db.session.query(Submission.script_id).filter_by(user_id=user.id)
+    # and haven't been recorded by this user yet (NOT EXISTS anti-join)
+    already_recorded = db.session.query(Submission.id).filter(
+        Submission.script_id == Script.id,
+        Submission.user_id == user.id
+    ).exists()
+    
+    # Approved recordings per script for this demographic, so saturated variants
+    # are skipped in the same round-trip
+    approved_counts = db.session.query(
+        Submission.script_id,
+        db.func.count().label('approved')
+    ).filter(
+        Submission.provider_gender == user.gender,
+        Submission.provider_age_group == user.age_group,
+        Submission.status == 'approved'
+    ).group_by(Submission.script_id).subquery()
+    current_approved = db.func.coalesce(approved_counts.c.approved, 0)
     
-    available_scripts = db.session.query(Script, ScriptVariantRequirement).join(
+    available_scripts = db.session.query(Script, ScriptVariantRequirement, current_approved).join(
         ScriptVariantRequirement, Script.id == ScriptVariantRequirement.script_id
+    ).outerjoin(
+        approved_counts, approved_counts.c.script_id == Script.id
     ).filter(
         Script.is_active == True,
         Script.language == language,
         ScriptVariantRequirement.enabled == True,
         ScriptVariantRequirement.gender == user.gender,
         ScriptVariantRequirement.age_group == user.age_group,
-        ~Script.id.in_(subquery)  # User hasn't recorded this script yet
+        ~already_recorded,  # User hasn't recorded this script yet
+        current_approved < ScriptVariantRequirement.target_total  # Still needs recordings for this variant
     ).order_by(Script.created_at.asc()).first()
     
     if not available_scripts:
         return jsonify({'message': 'No scripts available for your demographic profile', 'has_task': False})
     
-    script, requirement = available_scripts
-    
-    # Check if we still need more recordings for this variant
-    current_count = Submission.query.filter_by(
-        script_id=script.id,
-        provider_gender=user.gender,
-        provider_age_group=user.age_group,
-        status='approved'
-    ).count()
-    
-    if current_count >= requirement.target_total:
-        return jsonify({'message': 'Target reached for your demographic', 'has_task': False})
+    script, requirement, current_count = available_scripts
     
     return jsonify({
         'has_task': True,
@@ -1494,48 +1799,47 @@ def get_next_recording_task():
 def get_user_submissions(script_id):
     """Get submissions for a specific script - all submissions for admins, user's own for others"""
     user_id = session['user_id']
-    user_role = session.get('user_role', 'provider')
-    script = Script.query.get_or_404(script_id)
+    is_admin = session.get('user_role', 'provider') == 'admin'
+    _require_script(script_id)
     
-    # Admins see ALL submissions for this script
-    if user_role == 'admin':
-        submissions = Submission.query.filter_by(
-            script_id=script_id
-        ).order_by(Submission.created_at.desc()).all()
+    stmt = select(Submission).where(Submission.script_id == script_id).order_by(Submission.created_at.desc())
+    # Admins see ALL submissions for this script, with submitters loaded in one extra query
+    if is_admin:
+        stmt = stmt.options(SUBMISSION_USER_LOADER)
     else:
         # Non-admins only see their own submissions
-        submissions = Submission.query.filter_by(
-            user_id=user_id,
-            script_id=script_id
-        ).order_by(Submission.created_at.desc()).all()
+        stmt = stmt.where(Submission.user_id == user_id)
+    submissions = db.session.scalars(stmt).all()
     
     # Prepare submission data with submitter info for admins
-    submission_data = []
-    for sub in submissions:
-        item = {
+    def make_item(sub):
+        return {
             'id': sub.id,
             'text_content': sub.text_content or '',
             'transcript': sub.transcript or '',
             'audio_filename': sub.audio_filename,
             'audio_url': f'/api/submissions/{sub.id}/audio' if sub.audio_filename else None,
             'status': sub.status,
-            'created_at': sub.created_at.isoformat(),
+            'created_at': sub.created_at,
             'word_count': sub.word_count or 0,
             'duration': sub.duration
         }
-        
-        # Add submitter info for admins
-        if user_role == 'admin':
-            if sub.is_field_collection:
-                item['submitter'] = f"Field: {sub.speaker_name or 'Anonymous'}"
-                item['submitter_type'] = 'field'
-                item['speaker_location'] = sub.speaker_location or 'Unknown'
-            else:
-                user = User.query.get(sub.user_id) if sub.user_id else None
-                item['submitter'] = f"{user.first_name} {user.last_name}" if user else 'Unknown'
-                item['submitter_type'] = 'user'
-        
-        submission_data.append(item)
+    
+    def make_admin_item(sub):
+        item = make_item(sub)
+        if sub.is_field_collection:
+            item['submitter'] = f"Field: {sub.speaker_name or 'Anonymous'}"
+            item['submitter_type'] = 'field'
+            item['speaker_location'] = sub.speaker_location or 'Unknown'
+        else:
+            user = sub.user
+            item['submitter'] = f"{user.first_name} {user.last_name}" if user else 'Unknown'
+            item['submitter_type'] = 'user'
+        return item
+    
+    # The admin/non-admin choice is made once, not per row
+    build = make_admin_item if is_admin else make_item
+    submission_data = [build(sub) for sub in submissions]
     
     return jsonify({
         'success': True,
@@ -1543,6 +1847,28 @@ def get_user_submissions(script_id):
         'submissions': submission_data
     })
 
+def _audio_path_candidates(audio_filename):
+    """Yield the normalized places an uploaded audio file may live, skipping any outside UPLOAD_ROOT"""
+    # Secure path handling with subdirectory support
+    # Try different path combinations (for backwards compatibility)
+    possible_paths = [os.path.join(directory, audio_filename) for directory in AUDIO_SEARCH_DIRS]
+    basename = os.path.basename(audio_filename)
+    if basename != audio_filename:
+        # A bare filename would just repeat the first candidate
+        possible_paths.append(os.path.join(UPLOAD_ROOT, basename))
+    
+    for path in possible_paths:
+        normalized_path = os.path.normpath(path)
+        if normalized_path.startswith(UPLOAD_ROOT):
+            yield normalized_path
+
+def _resolve_audio_path(audio_filename):
+    """Return the on-disk path of an uploaded audio file, or None if it is missing"""
+    for path in _audio_path_candidates(audio_filename):
+        if os.path.exists(path):
+            return path
+    return None
+
 @app.route('/api/submissions/<int:submission_id>/audio', methods=['GET'])
 @require_auth
 def stream_submission_audio(submission_id):
@@ -1559,36 +1885,13 @@ def stream_submission_audio(submission_id):
     if not submission.audio_filename:
         abort(404)
     
-    # Secure path handling with subdirectory support
-    # Normalize path and ensure it stays within UPLOAD_FOLDER
     audio_filename = submission.audio_filename
-    
-    # Try different path combinations (for backwards compatibility)
-    possible_paths = [
-        os.path.join(app.config['UPLOAD_FOLDER'], audio_filename),
-        os.path.join(app.config['UPLOAD_FOLDER'], 'audio', audio_filename),
-        os.path.join(app.config['UPLOAD_FOLDER'], os.path.basename(audio_filename))
-    ]
-    
-    audio_path = None
-    for path in possible_paths:
-        # Normalize and check it's within UPLOAD_FOLDER
-        normalized_path = os.path.normpath(path)
-        if normalized_path.startswith(os.path.normpath(app.config['UPLOAD_FOLDER'])) and os.path.exists(normalized_path):
-            audio_path = normalized_path
-            break
-    
+    audio_path = _resolve_audio_path(audio_filename)
     if not audio_path:
         abort(404)
     
     # Determine mimetype
-    mimetype = 'audio/webm'
-    if audio_filename.endswith('.wav'):
-        mimetype = 'audio/wav'
-    elif audio_filename.endswith('.mp3'):
-        mimetype = 'audio/mpeg'
-    elif audio_filename.endswith('.mp4'):
-        mimetype = 'audio/mp4'
+    mimetype = AUDIO_MIMETYPES.get(os.path.splitext(audio_filename)[1].lower(), 'audio/webm')
     
     return send_file(audio_path, mimetype=mimetype)
 
@@ -1607,34 +1910,33 @@ def admin_data_export():
     language_filter = request.args.get('language', type=int)
     
     # Build query with optional language filter
-    query = Submission.query
+    stmt = select(Submission).order_by(Submission.created_at.desc())
     if language_filter:
-        query = query.filter_by(language_id=language_filter)
+        stmt = stmt.where(Submission.language_id == language_filter)
     
-    submissions = query.order_by(Submission.created_at.desc()).all()
+    submissions = db.session.scalars(stmt).all()
     
     # Enrich submissions with related data
     export_data = []
-    for sub in submissions:
-        script = Script.query.get(sub.script_id) if sub.script_id else None
-        
-        # Get submitter info
-        if sub.is_field_collection:
-            admin = User.query.get(sub.collected_by_admin_id) if sub.collected_by_admin_id else None
-            submitter = f"{admin.first_name} {admin.last_name}" if admin else 'Unknown Admin'
-            speaker_name = sub.speaker_name or 'Anonymous'
-        else:
-            user = User.query.get(sub.user_id) if sub.user_id else None
-            submitter = f"{user.first_name} {user.last_name}" if user else 'Unknown User'
-            speaker_name = submitter
-        
-        export_data.append({
-            'submission': sub,
-            'script_content': script.content if script else 'N/A',
-            'script_language': script.language if script else 'N/A',
-            'submitter': submitter,
-            'speaker_name': speaker_name
-        })
+    for batch, scripts, names in _export_batches(submissions):
+        for sub in batch:
+            script = scripts.get(sub.script_id)
+            
+            # Get submitter info
+            if sub.is_field_collection:
+                submitter = names.get(sub.collected_by_admin_id, 'Unknown Admin')
+                speaker_name = sub.speaker_name or 'Anonymous'
+            else:
+                submitter = names.get(sub.user_id, 'Unknown User')
+                speaker_name = submitter
+            
+            export_data.append({
+                'submission': sub,
+                'script_content': script.content if script else 'N/A',
+                'script_language': script.language if script else 'N/A',
+                'submitter': submitter,
+                'speaker_name': speaker_name
+            })
     
     # Get all active languages for the filter dropdown
     languages = Language.query.filter_by(is_active=True).order_by(Language.name).all()
@@ -1647,6 +1949,64 @@ def admin_data_export():
         selected_language=str(language_filter) if language_filter else ''
     )
 
+def _export_batches(submissions):
+    """Yield (batch, scripts by id, user names by id) for each EXPORT_BATCH_SIZE slice of submissions"""
+    submissions = iter(submissions)
+    while batch := list(itertools.islice(submissions, EXPORT_BATCH_SIZE)):
+        script_ids = {sub.script_id for sub in batch if sub.script_id}
+        user_ids = {sub.collected_by_admin_id if sub.is_field_collection else sub.user_id for sub in batch} - {None}
+        
+        scripts = {}
+        if script_ids:
+            scripts = {row.id: row for row in db.session.query(
+                Script.id, Script.content, Script.language
+            ).filter(Script.id.in_(script_ids))}
+        names = {}
+        if user_ids:
+            names = {row.id: f"{row.first_name} {row.last_name}" for row in db.session.query(
+                User.id, User.first_name, User.last_name
+            ).filter(User.id.in_(user_ids))}
+        yield batch, scripts, names
+
+def _export_rows_stmt(language_filter):
+    """Select each metadata CSV row as a flat tuple in column order, newest first"""
+    # Script text and both possible submitter names come from outer joins, and the
+    # empty-value defaults and Yes/No flag are computed in SQL, so rows go to the
+    # CSV writer almost as they come from the driver
+    provider = aliased(User)
+    collector = aliased(User)
+    blank = lambda column: func.coalesce(column, '').label(column.key)
+    collected_by = case(
+        (Submission.is_field_collection, collector.first_name + ' ' + collector.last_name),
+        else_=provider.first_name + ' ' + provider.last_name
+    )
+    stmt = select(
+        Submission.id, blank(Submission.audio_filename), Submission.script_id,
+        blank(Script.content), blank(Submission.transcript), blank(Script.language),
+        blank(Submission.provider_gender), blank(Submission.provider_age_group), blank(Submission.speaker_name),
+        blank(Submission.speaker_location),
+        case((Submission.is_field_collection, 'Yes'), else_='No').label('is_field_collection'),
+        func.coalesce(collected_by, 'Unknown').label('collected_by'), Submission.status,
+        func.coalesce(Submission.word_count, 0).label('word_count'), Submission.created_at
+    ).outerjoin(Script, Submission.script_id == Script.id).outerjoin(
+        provider, Submission.user_id == provider.id
+    ).outerjoin(collector, Submission.collected_by_admin_id == collector.id)
+    if language_filter:
+        stmt = stmt.where(Submission.language_id == language_filter)
+    return stmt.order_by(Submission.created_at.desc())
+
+def _export_csv_rows(rows):
+    """Yield the metadata CSV header followed by one row per _export_rows_stmt result"""
+    yield (
+        'ID', 'Audio Filename', 'Script ID', 'Script Content', 'Transcript', 'Language',
+        'Speaker Gender', 'Speaker Age Group', 'Speaker Name', 'Speaker Location',
+        'Is Field Collection', 'Collected By', 'Status', 'Word Count', 'Created At'
+    )
+    
+    # Only the timestamp still needs formatting in Python
+    for *fields, created_at in rows:
+        yield (*fields, created_at.strftime('%Y-%m-%d %H:%M:%S') if created_at else '')
+
 @app.route('/admin/data-export/csv')
 @require_role(['admin'])
 def export_data_csv():
@@ -1654,61 +2014,102 @@ def export_data_csv():
     # Get language filter from query params
     language_filter = request.args.get('language', type=int)
     
-    # Build query with optional language filter
-    query = Submission.query
-    if language_filter:
-        query = query.filter_by(language_id=language_filter)
+    submissions = db.session.execute(
+        _export_rows_stmt(language_filter).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
     
-    submissions = query.order_by(Submission.created_at.desc()).all()
+    def generate():
+        # Each batch of rows is written by one writerows() call into a small buffer that
+        # is handed out and cleared, so neither the result set nor the CSV is held whole
+        output = io.StringIO()
+        writer = csv.writer(output)
+        rows = _export_csv_rows(submissions)
+        while True:
+            writer.writerows(itertools.islice(rows, EXPORT_BATCH_SIZE))
+            if not output.tell():
+                break
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
     
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
+    download_name = f'voicescript_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename={download_name}'}
+    )
+
+class _ZipStreamSink(io.RawIOBase):
+    """Unseekable write target that hands ZipFile output to a response generator"""
+    def __init__(self):
+        self._chunks = []
     
-    # Write header
-    writer.writerow([
-        'ID', 'Audio Filename', 'Script ID', 'Script Content', 'Transcript', 'Language',
-        'Speaker Gender', 'Speaker Age Group', 'Speaker Name', 'Speaker Location',
-        'Is Field Collection', 'Collected By', 'Status', 'Word Count', 'Created At'
-    ])
+    def writable(self):
+        return True
     
-    # Write data rows
-    for sub in submissions:
-        script = Script.query.get(sub.script_id) if sub.script_id else None
-        
-        # Get collector info
-        if sub.is_field_collection:
-            admin = User.query.get(sub.collected_by_admin_id) if sub.collected_by_admin_id else None
-            collector = f"{admin.first_name} {admin.last_name}" if admin else 'Unknown'
-        else:
-            user = User.query.get(sub.user_id) if sub.user_id else None
-            collector = f"{user.first_name} {user.last_name}" if user else 'Unknown'
-        
-        writer.writerow([
-            sub.id,
-            sub.audio_filename or '',
-            sub.script_id or '',
-            script.content if script else '',
-            sub.transcript or '',
-            script.language if script else '',
-            sub.provider_gender or '',
-            sub.provider_age_group or '',
-            sub.speaker_name or '',
-            sub.speaker_location or '',
-            'Yes' if sub.is_field_collection else 'No',
-            collector,
-            sub.status,
-            sub.word_count or 0,
-            sub.created_at.strftime('%Y-%m-%d %H:%M:%S') if sub.created_at else ''
-        ])
-    
-    # Prepare response
-    output.seek(0)
-    return send_file(
-        io.BytesIO(output.getvalue().encode('utf-8')),
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=f'voicescript_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+@app.route('/admin/data-export/zip')
+@require_role(['admin'])
+def export_data_zip():
+    """Stream all recordings plus the metadata CSV as a ZIP archive"""
+    language_filter = request.args.get('language', type=int)
+    submissions = db.session.execute(
+        _export_rows_stmt(language_filter).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    
+    def generate():
+        # One pass over the rows spools the CSV to a temp file and keeps only the audio
+        # filenames, so the result set is never held whole while the archive streams
+        audio_filenames = []
+        
+        def note_audio(rows):
+            for row in rows:
+                if row.audio_filename:
+                    audio_filenames.append(row.audio_filename)
+                yield row
+        
+        sink = _ZipStreamSink()
+        with zipfile.ZipFile(sink, 'w') as zf, \
+                tempfile.TemporaryFile('w+', encoding='utf-8', newline='') as metadata:
+            csv.writer(metadata).writerows(_export_csv_rows(note_audio(submissions)))
+            metadata.seek(0)
+            
+            # Metadata compresses well; audio is already compressed so it is stored as-is
+            info = zipfile.ZipInfo('metadata.csv', datetime.now().timetuple()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o600 << 16
+            with zf.open(info, 'w') as dest:
+                while chunk := metadata.read(UPLOAD_CHUNK_SIZE):
+                    dest.write(chunk.encode('utf-8'))
+                    yield sink.drain()
+            yield sink.drain()
+            
+            for audio_filename in audio_filenames:
+                audio_path = _resolve_audio_path(audio_filename)
+                if not audio_path:
+                    continue
+                info = zipfile.ZipInfo.from_file(audio_path, f'audio/{os.path.basename(audio_filename)}')
+                info.compress_type = zipfile.ZIP_STORED
+                with open(audio_path, 'rb') as src, zf.open(info, 'w') as dest:
+                    while chunk := src.read(UPLOAD_CHUNK_SIZE):
+                        dest.write(chunk)
+                        yield sink.drain()
+                yield sink.drain()
+        yield sink.drain()
+    
+    download_name = f'voicescript_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.zip'
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename={download_name}'}
     )
 
 @app.route('/api/submissions/<int:submission_id>', methods=['DELETE'])
@@ -1722,33 +2123,23 @@ def admin_delete_submission(submission_id):
     if submission.audio_filename:
         audio_filename = submission.audio_filename
         
-        # Try different path combinations (same as stream endpoint)
-        possible_paths = [
-            os.path.join(app.config['UPLOAD_FOLDER'], audio_filename),
-            os.path.join(app.config['UPLOAD_FOLDER'], 'audio', audio_filename),
-            os.path.join(app.config['UPLOAD_FOLDER'], os.path.basename(audio_filename))
-        ]
-        
-        audio_path = None
-        for path in possible_paths:
-            # Normalize and check it's within UPLOAD_FOLDER
-            normalized_path = os.path.normpath(path)
-            if normalized_path.startswith(os.path.normpath(app.config['UPLOAD_FOLDER'])) and os.path.exists(normalized_path):
-                audio_path = normalized_path
-                break
-        
-        if audio_path:
+        # Try the same path combinations as the stream endpoint; unlinking is the existence check
+        for audio_path in _audio_path_candidates(audio_filename):
             try:
-                os.remove(audio_path)
-                deleted_file = True
-                app.logger.info(f"Deleted audio file: {audio_path}")
+                os.unlink(audio_path)
+            except FileNotFoundError:
+                continue
             except Exception as e:
                 app.logger.error(f"Failed to delete audio file {audio_path}: {e}")
                 return jsonify({
                     'success': False,
                     'error': f'Failed to delete audio file: {str(e)}'
                 }), 500
-        else:
+            deleted_file = True
+            app.logger.info(f"Deleted audio file: {audio_path}")
+            break
+        
+        if not deleted_file:
             app.logger.warning(f"Audio file not found for submission {submission_id}: {audio_filename}")
     
     # Delete the submission record
@@ -1765,11 +2156,11 @@ def admin_delete_submission(submission_id):
 @require_role(['admin'])
 def admin_roles():
     users = User.query.order_by(User.created_at.desc()).all()
-    role_stats = {
-        'admin': User.query.filter_by(role='admin').count(),
-        'reviewer': User.query.filter_by(role='reviewer').count(),
-        'provider': User.query.filter_by(role='provider').count()
-    }
+    # Every user is already loaded, so count roles here rather than with three more queries
+    role_stats = {'admin': 0, 'reviewer': 0, 'provider': 0}
+    for user in users:
+        if user.role in role_stats:
+            role_stats[user.role] += 1
     return render_template('admin_roles.html', users=users, role_stats=role_stats)
 
 @app.route('/api/users/<int:user_id>/role', methods=['PUT'])
@@ -1792,7 +2183,7 @@ def create_user():
     data = request.json or {}
     
     # Check if user already exists
-    if User.query.filter_by(email=data['email']).first():
+    if db.session.scalar(select(exists().where(User.email == data['email']))):
         return jsonify({'success': False, 'error': 'User already exists'}), 400
     
     user = User(
@@ -1843,7 +2234,7 @@ def add_language():
     data = request.json or {}
     
     # Check if language code already exists
-    if Language.query.filter_by(code=data['code']).first():
+    if db.session.scalar(select(exists().where(Language.code == data['code']))):
         return jsonify({'success': False, 'error': 'Language code already exists'}), 400
     
     language = Language(
@@ -1867,6 +2258,7 @@ def add_language():
     db.session.add(pricing)
     
     db.session.commit()
+    invalidate_cache(ACTIVE_LANGUAGES_CACHE_KEY, LANGUAGES_BY_CODE_CACHE_KEY, PRICING_CACHE_KEY)
     return jsonify({'success': True, 'id': language.id})
 
 
@@ -1901,22 +2293,18 @@ def update_language(language_code):
             db.session.add(pricing)
     
     db.session.commit()
+    invalidate_cache(ACTIVE_LANGUAGES_CACHE_KEY, LANGUAGES_BY_CODE_CACHE_KEY, PRICING_CACHE_KEY)
     return jsonify({'success': True})
 
 @app.route('/api/languages/<language_code>', methods=['GET'])
 @require_role(['admin'])
 def get_language(language_code):
     """Get language details"""
-    language = Language.query.filter_by(code=language_code).first()
+    language = _languages_by_code().get(language_code)
     if not language:
         return jsonify({'success': False, 'error': 'Language not found'}), 404
     
-    return jsonify({
-        'code': language.code,
-        'name': language.name,
-        'native_name': language.native_name,
-        'is_active': language.is_active
-    })
+    return jsonify(language)
 
 @app.route('/api/languages/<language_code>', methods=['DELETE'])
 @require_role(['admin'])
@@ -1940,6 +2328,7 @@ def delete_language(language_code):
     # Delete the language
     db.session.delete(language)
     db.session.commit()
+    invalidate_cache(ACTIVE_LANGUAGES_CACHE_KEY, LANGUAGES_BY_CODE_CACHE_KEY, PRICING_CACHE_KEY)
     
     app.logger.info(f"Language deleted: {language_code}")
     return jsonify({'success': True})
@@ -1948,7 +2337,7 @@ def delete_language(language_code):
 @require_role(['admin'])
 def get_pricing(language_code):
     """Get pricing for a language"""
-    pricing = PricingRate.query.filter_by(language_code=language_code).first()
+    pricing = _pricing_rates().get(language_code)
     if not pricing:
         return jsonify({
             'provider_rate_per_word': 0.010,
@@ -2018,25 +2407,34 @@ def create_demo_data(force=False):
             {'email': 'female.elderly@demo.com', 'password': 'demo123', 'first_name': 'Margaret', 'last_name': 'Garcia', 'role': 'provider', 'gender': 'female', 'age_group': 'Elderly (60+)'}
         ]
         
-        for user_data in demo_users:
-            # Check if user exists by trying to query, but handle schema errors gracefully
+        # Look up which demo rows already exist with one query per table, handling schema errors gracefully
+        def existing(column, values):
             try:
-                existing_user = User.query.filter_by(email=user_data['email']).first()
+                return set(db.session.scalars(select(column).where(column.in_(values))))
             except Exception:
-                existing_user = None
-                
-            if not existing_user:
-                user = User(
-                    email=user_data['email'],
-                    first_name=user_data['first_name'],
-                    last_name=user_data['last_name'],
-                    role=user_data['role'],
-                    gender=user_data.get('gender', 'prefer-not-to-say'),
-                    age_group=user_data.get('age_group', 'Adult (20–59)'),
-                    auth_provider='local'  # Set default auth provider for demo users
-                )
-                user.set_password(user_data['password'])
-                db.session.add(user)
+                db.session.rollback()
+                return set()
+        
+        # Every demo account shares a password, so hash each distinct password once
+        password_hashes = {}
+        existing_emails = existing(User.email, [user_data['email'] for user_data in demo_users])
+        user_rows = []
+        for user_data in demo_users:
+            if user_data['email'] in existing_emails:
+                continue
+            password = user_data['password']
+            if password not in password_hashes:
+                password_hashes[password] = generate_password_hash(password)
+            user_rows.append({
+                'email': user_data['email'],
+                'password_hash': password_hashes[password],
+                'first_name': user_data['first_name'],
+                'last_name': user_data['last_name'],
+                'role': user_data['role'],
+                'gender': user_data.get('gender', 'prefer-not-to-say'),
+                'age_group': user_data.get('age_group', 'Adult (20–59)'),
+                'auth_provider': 'local'  # Set default auth provider for demo users
+            })
         
         # Create demo scripts - matching init_data.sql exactly
         demo_scripts = [
@@ -2047,15 +2445,12 @@ def create_demo_data(force=False):
             {'content': 'Artificial intelligence, machine learning, natural language processing, neural networks, deep learning, algorithm', 'language': 'en', 'is_active': True}
         ]
         
-        for script_data in demo_scripts:
-            try:
-                existing_script = Script.query.filter_by(content=script_data['content']).first()
-            except Exception:
-                existing_script = None
-                
-            if not existing_script:
-                script = Script(**script_data)
-                db.session.add(script)
+        existing_contents = existing(Script.content, [script_data['content'] for script_data in demo_scripts])
+        # Bulk mappings skip the content validator, so word_count is set here
+        script_rows = [
+            dict(script_data, word_count=count_words(script_data['content']))
+            for script_data in demo_scripts if script_data['content'] not in existing_contents
+        ]
         
         # Create demo languages with pricing - matching init_data.sql exactly
         demo_languages = [
@@ -2071,30 +2466,26 @@ def create_demo_data(force=False):
             {'name': 'Korean', 'code': 'ko', 'native_name': '한국어', 'provider_rate': 0.020, 'reviewer_rate': 3.00, 'currency': 'USD'},
         ]
         
-        for lang_data in demo_languages:
-            try:
-                existing_language = Language.query.filter_by(code=lang_data['code']).first()
-            except Exception:
-                existing_language = None
-                
-            if not existing_language:
-                # Create language
-                language = Language(
-                    name=lang_data['name'],
-                    code=lang_data['code'],
-                    native_name=lang_data['native_name'],
-                    is_active=True
-                )
-                db.session.add(language)
-                
-                # Create corresponding pricing
-                pricing = PricingRate(
-                    language_code=lang_data['code'],
-                    provider_rate_per_word=lang_data['provider_rate'],
-                    reviewer_rate_per_submission=lang_data['reviewer_rate'],
-                    currency=lang_data['currency']
-                )
-                db.session.add(pricing)
+        existing_codes = existing(Language.code, [lang_data['code'] for lang_data in demo_languages])
+        new_languages = [lang_data for lang_data in demo_languages if lang_data['code'] not in existing_codes]
+        language_rows = [{
+            'name': lang_data['name'],
+            'code': lang_data['code'],
+            'native_name': lang_data['native_name'],
+            'is_active': True
+        } for lang_data in new_languages]
+        # Create corresponding pricing
+        pricing_rows = [{
+            'language_code': lang_data['code'],
+            'provider_rate_per_word': lang_data['provider_rate'],
+            'reviewer_rate_per_submission': lang_data['reviewer_rate'],
+            'currency': lang_data['currency']
+        } for lang_data in new_languages]
+        
+        # One executemany per table; languages go first since pricing references them
+        for model, rows in ((User, user_rows), (Language, language_rows), (PricingRate, pricing_rows), (Script, script_rows)):
+            if rows:
+                db.session.bulk_insert_mappings(model, rows)
         
         db.session.commit()
         app.logger.info("Database initialized with demo data")
@@ -2106,40 +2497,101 @@ def create_demo_data(force=False):
 
 
 # Initialize database when the module is loaded (for both dev and production)
+# Arbitrary application-wide key for the PostgreSQL advisory lock taken by init_database()
+INIT_DB_LOCK_KEY = 0x766f6963
+
 def init_database():
     """
     Initialize database with schema and demo data.
     Supports both migration-based (preferred) and SQLAlchemy-based (fallback) workflows.
+    Returns whether initialization succeeded; in production a failure raises instead.
     """
     with app.app_context():
         try:
-            # Try migration-based approach first (check if schema_version table exists)
-            try:
-                with db.engine.connect() as conn:
-                    result = conn.execute(db.text("SELECT 1 FROM schema_version LIMIT 1"))
-                    result.fetchone()
-                app.logger.info("Database initialized via migrations")
-            except:
-                # Fallback: Use SQLAlchemy db.create_all() if migrations haven't run
-                app.logger.info("Migration table not found, using SQLAlchemy to create schema...")
-                db.create_all()
-                app.logger.info("Database tables created via SQLAlchemy")
+            # Workers initialize independently; on PostgreSQL an advisory lock lets one of
+            # them create the schema/demo data while the others wait and then find it done
+            use_lock = db.engine.dialect.name == 'postgresql'
+            with db.engine.connect() as lock_conn:
+                if use_lock:
+                    lock_conn.execute(text('SELECT pg_advisory_lock(:key)'), {'key': INIT_DB_LOCK_KEY})
+                try:
+                    # Try migration-based approach first (check if schema_version table exists)
+                    try:
+                        with db.engine.connect() as conn:
+                            result = conn.execute(db.text("SELECT 1 FROM schema_version LIMIT 1"))
+                            result.fetchone()
+                        # Migrations no longer run after an import-time create_all(), so the
+                        # tables they don't define (pricing_rates, app_settings) come from the models
+                        db.create_all()
+                        app.logger.info("Database initialized via migrations")
+                    except:
+                        # Fallback: Use SQLAlchemy db.create_all() if migrations haven't run
+                        app.logger.info("Migration table not found, using SQLAlchemy to create schema...")
+                        db.create_all()
+                        app.logger.info("Database tables created via SQLAlchemy")
+                    
+                    # Only create demo data in development mode
+                    if not is_production:
+                        if User.query.count() == 0:
+                            create_demo_data()
+                            app.logger.info("Database initialized with demo data")
+                        else:
+                            app.logger.info("Database already contains data, skipping demo data creation")
+                    else:
+                        app.logger.info("Production mode: Demo data creation skipped")
+                finally:
+                    if use_lock:
+                        lock_conn.execute(text('SELECT pg_advisory_unlock(:key)'), {'key': INIT_DB_LOCK_KEY})
             
-            # Only create demo data in development mode
-            if os.environ.get('FLASK_ENV') != 'production':
-                if User.query.count() == 0:
-                    create_demo_data()
-                    app.logger.info("Database initialized with demo data")
-                else:
-                    app.logger.info("Database already contains data, skipping demo data creation")
-            else:
-                app.logger.info("Production mode: Demo data creation skipped")
+            # Load the settings snapshot this process serves from
+            load_app_settings()
+            return True
                 
         except Exception as e:
             app.logger.error(f"Database initialization error: {e}")
-            if os.environ.get('FLASK_ENV') == 'production':
+            if is_production:
                 raise  # Fail fast in production
+            return False
+
+# After a failed initialization, requests skip it for this long instead of each one
+# queueing on the lock to retry it while the database is still unavailable
+INIT_DB_RETRY_SECONDS = 30
+
+_database_ready = False
+_database_init_retry_at = 0.0
+_database_init_lock = threading.Lock()
+
+@app.before_request
+def ensure_database_initialized():
+    """Run init_database() once per process, before the first request it serves"""
+    global _database_ready, _database_init_retry_at
+    # The health check reports on the database itself and must not wait on (or retry) init
+    if _database_ready or request.endpoint == 'health_check':
+        return
+    if time.monotonic() < _database_init_retry_at:
+        return
+    with _database_init_lock:
+        if _database_ready or time.monotonic() < _database_init_retry_at:
+            return
+        try:
+            _database_ready = init_database()
+        finally:
+            if not _database_ready:
+                _database_init_retry_at = time.monotonic() + INIT_DB_RETRY_SECONDS
+
+def _require_database():
+    """Initialize the database for a CLI command, which gets no first-request init"""
+    if not init_database():
+        raise click.ClickException('Database initialization failed, see the log above')
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create the schema if needed and seed demo data (development only)."""
+    _require_database()
+
 
+# Built once; container healthchecks hit the endpoint below every few seconds
+HEALTH_CHECK_STMT = text('SELECT 1')
 
 # Health check endpoint for Docker
 @app.route('/health', methods=['GET'])
@@ -2147,8 +2599,7 @@ def health_check():
     """Health check endpoint for Docker container monitoring"""
     try:
         # Test database connection
-        result = db.session.execute(db.text('SELECT 1'))
-        result.fetchone()
+        db.session.execute(HEALTH_CHECK_STMT).scalar()
         return jsonify({
             'status': 'healthy',
             'database': 'connected',
@@ -2178,15 +2629,28 @@ def forbidden_error(error):
     return render_template('403.html'), 403
 
 # Security headers for production
+SECURITY_HEADERS = {
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
+}
+
 @app.after_request
 def after_request(response):
     if is_production:
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'DENY'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-        response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
+        response.headers.update(SECURITY_HEADERS)
     return response
 
+# Accounts and scripts removed by `flask seed-demo --force`
+DEMO_EMAILS = (
+    'provider@demo.com', 'reviewer@demo.com', 'admin@demo.com',
+    'john.provider@example.com', 'maria.provider@example.com',
+    'male.child@demo.com', 'male.teen@demo.com', 'male.adult@demo.com', 'male.elderly@demo.com',
+    'female.child@demo.com', 'female.teen@demo.com', 'female.adult@demo.com', 'female.elderly@demo.com'
+)
+DEMO_TITLES = ('Introduction Script', 'Weather Description', 'Story Reading')
+
 # Flask CLI Commands
 @app.cli.command('seed-demo')
 @click.option('--force', is_flag=True, help='Force recreation of demo data (clears existing demo data first)')
@@ -2202,6 +2666,8 @@ def seed_demo_command(force, yes):
             return
         app.logger.warning("⚠️  Seeding demo data in PRODUCTION mode (--yes flag provided)")
     
+    _require_database()
+    
     with app.app_context():
         try:
             # If force flag is set, delete existing demo data first
@@ -2209,34 +2675,30 @@ def seed_demo_command(force, yes):
                 app.logger.info("🗑️  Force flag set - removing existing demo data...")
                 
                 # Delete demo users (by known email patterns)
-                demo_emails = [
-                    'provider@demo.com', 'reviewer@demo.com', 'admin@demo.com',
-                    'john.provider@example.com', 'maria.provider@example.com',
-                    'male.child@demo.com', 'male.teen@demo.com', 'male.adult@demo.com', 'male.elderly@demo.com',
-                    'female.child@demo.com', 'female.teen@demo.com', 'female.adult@demo.com', 'female.elderly@demo.com'
-                ]
-                deleted_users = User.query.filter(User.email.in_(demo_emails)).delete(synchronize_session=False)
+                deleted_users = User.query.filter(User.email.in_(DEMO_EMAILS)).delete(synchronize_session=False)
                 
                 # Delete demo scripts (by known titles)
-                demo_titles = ['Introduction Script', 'Weather Description', 'Story Reading']
-                deleted_scripts = Script.query.filter(Script.title.in_(demo_titles)).delete(synchronize_session=False)
+                deleted_scripts = Script.query.filter(Script.title.in_(DEMO_TITLES)).delete(synchronize_session=False)
                 
                 db.session.commit()
                 app.logger.info(f"   ✅ Deleted {deleted_users} demo users, {deleted_scripts} demo scripts")
             
+            def table_counts():
+                """Count users, scripts and languages in a single round-trip"""
+                return db.session.execute(select(*(
+                    select(func.count()).select_from(model).scalar_subquery()
+                    for model in (User, Script, Language)
+                ))).one()
+            
             # Count existing data before seeding
-            users_before = User.query.count()
-            scripts_before = Script.query.count()
-            languages_before = Language.query.count()
+            users_before, scripts_before, languages_before = table_counts()
             
             # Create demo data
             app.logger.info("🌱 Seeding demo data...")
             create_demo_data(force=True)  # Always run when using CLI command
             
             # Count after seeding
-            users_after = User.query.count()
-            scripts_after = Script.query.count()
-            languages_after = Language.query.count()
+            users_after, scripts_after, languages_after = table_counts()
             
             # Summary
             app.logger.info("✅ Demo data seeding completed successfully!")
@@ -2257,40 +2719,23 @@ def seed_demo_command(force, yes):
 @app.cli.command('migrate-field-collection')
 def migrate_field_collection_command():
     """Add field collection columns to submissions table"""
+    _require_database()
+    
     with app.app_context():
         try:
             app.logger.info("🔄 Adding field collection columns to submissions table...")
             
-            # Add new columns to submissions table
-            with db.engine.connect() as conn:
-                # Make user_id nullable
-                conn.execute(text("ALTER TABLE submissions ALTER COLUMN user_id DROP NOT NULL"))
-                conn.commit()
-                
-                # Add new columns if they don't exist
-                try:
-                    conn.execute(text("ALTER TABLE submissions ADD COLUMN collected_by_admin_id INTEGER REFERENCES users(id)"))
-                    conn.commit()
-                except Exception:
-                    pass  # Column already exists
-                
-                try:
-                    conn.execute(text("ALTER TABLE submissions ADD COLUMN speaker_name VARCHAR(100)"))
-                    conn.commit()
-                except Exception:
-                    pass
-                
-                try:
-                    conn.execute(text("ALTER TABLE submissions ADD COLUMN speaker_location VARCHAR(255)"))
-                    conn.commit()
-                except Exception:
-                    pass
-                
-                try:
-                    conn.execute(text("ALTER TABLE submissions ADD COLUMN is_field_collection BOOLEAN DEFAULT FALSE"))
-                    conn.commit()
-                except Exception:
-                    pass
+            # One atomic ALTER: user_id becomes nullable and the new columns are added
+            # unless they already exist, so re-running the command is a no-op
+            with db.engine.begin() as conn:
+                conn.execute(text("""
+                    ALTER TABLE submissions
+                        ALTER COLUMN user_id DROP NOT NULL,
+                        ADD COLUMN IF NOT EXISTS collected_by_admin_id INTEGER REFERENCES users(id),
+                        ADD COLUMN IF NOT EXISTS speaker_name VARCHAR(100),
+                        ADD COLUMN IF NOT EXISTS speaker_location VARCHAR(255),
+                        ADD COLUMN IF NOT EXISTS is_field_collection BOOLEAN DEFAULT FALSE
+                """))
             
             app.logger.info("✅ Field collection migration completed successfully!")
             
@@ -2298,8 +2743,10 @@ def migrate_field_collection_command():
             app.logger.error(f"❌ Error during migration: {e}")
             raise
 
-# Initialize database on module load
-init_database()
+# Initialization normally runs lazily on the first request (see ensure_database_initialized),
+# so importing the app opens no connections; INIT_DB_ON_IMPORT=1 restores the eager behaviour
+if os.environ.get('INIT_DB_ON_IMPORT') == '1':
+    _database_ready = init_database()
 
 if __name__ == '__main__':
     # Direct execution mode - use proper WSGI server for production
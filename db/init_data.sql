@@ -53,4 +53,9 @@ INSERT INTO scripts (content, language, is_active) VALUES
 ('Once upon a time, in a land far away, there lived a wise old owl who helped all the forest animals solve their problems.', 'en', TRUE),
 ('Please read the following numbers clearly: 123, 456, 789, 1000, 2023, 15.5, 99.99, 0.01', 'en', TRUE),
 ('Artificial intelligence, machine learning, natural language processing, neural networks, deep learning, algorithm', 'en', TRUE)
-ON CONFLICT DO NOTHING;
\ No newline at end of file
+ON CONFLICT DO NOTHING;
+
+-- Count words for the demo scripts (same whitespace splitting as the app)
+UPDATE scripts
+SET word_count = (SELECT count(*) FROM regexp_matches(content, '\S+', 'g'))
+WHERE word_count = 0;
\ No newline at end of file
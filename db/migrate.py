@@ -6,11 +6,31 @@ Handles migration from SQLite to PostgreSQL and schema updates
 
 import os
 import sys
+import csv
+import time
+import tempfile
 import psycopg2
 import sqlite3
 from datetime import datetime
+from itertools import islice
+from psycopg2.extras import execute_values
 from werkzeug.security import generate_password_hash
 
+# Rows per multi-row INSERT statement, and rows per committed transaction
+INSERT_PAGE_SIZE = 1000
+MIGRATION_BATCH_SIZE = 10000
+# Submission tables at least this large are loaded with COPY instead of INSERTs;
+# the CSV staged for COPY spills from memory to a temp file past COPY_SPOOL_SIZE
+COPY_THRESHOLD = 100000
+COPY_SPOOL_SIZE = 64 * 1024 * 1024
+# Connection attempts before giving up; waits double from 1s between attempts
+CONNECT_ATTEMPTS = 5
+
+SUBMISSION_COLUMNS = (
+    'id, user_id, script_id, text_content, audio_filename, status, created_at, '
+    'reviewed_at, reviewed_by, review_notes, quality_score, word_count, duration'
+)
+
 def get_db_connection():
     """Get PostgreSQL database connection"""
     database_url = os.environ.get('DATABASE_URL')
@@ -18,12 +38,21 @@ def get_db_connection():
         print("❌ DATABASE_URL environment variable not found")
         sys.exit(1)
     
-    try:
-        conn = psycopg2.connect(database_url)
-        return conn
-    except Exception as e:
-        print(f"❌ Failed to connect to PostgreSQL: {e}")
-        sys.exit(1)
+    for attempt in range(CONNECT_ATTEMPTS):
+        try:
+            conn = psycopg2.connect(database_url, connect_timeout=5)
+            return conn
+        except psycopg2.OperationalError as e:
+            # The server may still be starting or briefly unreachable; back off and retry
+            if attempt == CONNECT_ATTEMPTS - 1:
+                print(f"❌ Failed to connect to PostgreSQL: {e}")
+                sys.exit(1)
+            delay = 2 ** attempt
+            print(f"⚠️  PostgreSQL not reachable, retrying in {delay}s: {e}")
+            time.sleep(delay)
+        except Exception as e:
+            print(f"❌ Failed to connect to PostgreSQL: {e}")
+            sys.exit(1)
 
 def run_sql_file(conn, filename):
     """Execute SQL commands from a file"""
@@ -31,10 +60,9 @@ def run_sql_file(conn, filename):
         with open(filename, 'r') as file:
             sql_content = file.read()
         
-        cursor = conn.cursor()
-        cursor.execute(sql_content)
+        with conn.cursor() as cursor:
+            cursor.execute(sql_content)
         conn.commit()
-        cursor.close()
         print(f"✅ Successfully executed {filename}")
         
     except Exception as e:
@@ -53,6 +81,42 @@ def init_demo_data(conn):
     print("📊 Initializing demo data...")
     return run_sql_file(conn, 'init_data.sql')
 
+def insert_in_batches(pg_conn, insert_sql, rows):
+    """Insert value tuples with execute_values, committing every MIGRATION_BATCH_SIZE rows"""
+    rows = iter(rows)
+    with pg_conn.cursor() as pg_cursor:
+        while batch := list(islice(rows, MIGRATION_BATCH_SIZE)):
+            execute_values(pg_cursor, insert_sql, batch, page_size=INSERT_PAGE_SIZE)
+            pg_conn.commit()
+
+def existing_values(pg_conn, query):
+    """Return the set of values produced by a single-column query"""
+    with pg_conn.cursor() as pg_cursor:
+        pg_cursor.execute(query)
+        return {row[0] for row in pg_cursor}
+
+def copy_submissions(pg_conn, rows):
+    """Load submission value tuples with COPY through a staging table, then merge them"""
+    # COPY has no ON CONFLICT, so rows land in a temp table first and are merged with
+    # a single INSERT ... SELECT that keeps the same skip-duplicates behaviour
+    with tempfile.SpooledTemporaryFile(max_size=COPY_SPOOL_SIZE, mode='w+', newline='') as buf:
+        csv.writer(buf).writerows(
+            tuple(r'\N' if value is None else value for value in row) for row in rows
+        )
+        buf.seek(0)
+        
+        with pg_conn.cursor() as pg_cursor:
+            pg_cursor.execute("CREATE TEMP TABLE submissions_staging (LIKE submissions) ON COMMIT DROP")
+            pg_cursor.copy_expert(
+                f"COPY submissions_staging ({SUBMISSION_COLUMNS}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buf
+            )
+            pg_cursor.execute(f"""
+                INSERT INTO submissions ({SUBMISSION_COLUMNS})
+                SELECT {SUBMISSION_COLUMNS} FROM submissions_staging
+                ON CONFLICT DO NOTHING
+            """)
+            pg_conn.commit()
+
 def migrate_from_sqlite():
     """Migrate existing data from SQLite to PostgreSQL"""
     sqlite_path = 'instance/voicescript.db'
@@ -68,66 +132,77 @@ def migrate_from_sqlite():
     sqlite_conn.row_factory = sqlite3.Row
     
     try:
+        # Users and scripts already in PostgreSQL (e.g. demo data) are skipped up
+        # front, so the inserts below need no ON CONFLICT handling
+        existing_user_ids = existing_values(pg_conn, "SELECT id FROM users")
+        existing_emails = existing_values(pg_conn, "SELECT email FROM users")
+        existing_script_ids = existing_values(pg_conn, "SELECT id FROM scripts")
+        
+        # Each table is read straight off the SQLite cursor as batches are sent, so
+        # only one batch of rows is held in memory at a time
         # Migrate users (with new fields defaulted)
         sqlite_cursor = sqlite_conn.cursor()
         sqlite_cursor.execute("SELECT * FROM user")
-        users = sqlite_cursor.fetchall()
         
-        pg_cursor = pg_conn.cursor()
-        for user in users:
-            # Insert user with default gender and age_group
-            pg_cursor.execute("""
-                INSERT INTO users (id, email, password_hash, first_name, last_name, role, 
-                                 google_id, profile_picture, auth_provider, gender, age_group, created_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (email) DO NOTHING
-            """, (
-                user['id'], user['email'], user['password_hash'], 
-                user['first_name'], user['last_name'], user['role'],
-                user.get('google_id'), user.get('profile_picture'), 
-                user.get('auth_provider', 'local'),
-                'prefer-not-to-say',  # Default gender
-                'Adult (20–59)',      # Default age group
-                user.get('created_at', datetime.utcnow())
-            ))
+        # Insert users with default gender and age_group
+        insert_in_batches(pg_conn, """
+            INSERT INTO users (id, email, password_hash, first_name, last_name, role, 
+                             google_id, profile_picture, auth_provider, gender, age_group, created_at)
+            VALUES %s
+        """, ((
+            user['id'], user['email'], user['password_hash'], 
+            user['first_name'], user['last_name'], user['role'],
+            user.get('google_id'), user.get('profile_picture'), 
+            user.get('auth_provider', 'local'),
+            'prefer-not-to-say',  # Default gender
+            'Adult (20–59)',      # Default age group
+            user.get('created_at', datetime.utcnow())
+        ) for user in map(dict, sqlite_cursor)
+            if user['id'] not in existing_user_ids and user['email'] not in existing_emails))
         
         # Migrate scripts
         sqlite_cursor.execute("SELECT * FROM script")
-        scripts = sqlite_cursor.fetchall()
-        
-        for script in scripts:
-            pg_cursor.execute("""
-                INSERT INTO scripts (id, title, content, language, category, is_active, created_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT DO NOTHING
-            """, (
-                script['id'], script['title'], script['content'],
-                script.get('language', 'en'), script.get('category'),
-                script.get('is_active', True), script.get('created_at', datetime.utcnow())
-            ))
+        insert_in_batches(pg_conn, """
+            INSERT INTO scripts (id, title, content, language, category, is_active, word_count, created_at)
+            VALUES %s
+        """, ((
+            script['id'], script['title'], script['content'],
+            script.get('language', 'en'), script.get('category'),
+            script.get('is_active', True), len((script['content'] or '').split()),
+            script.get('created_at', datetime.utcnow())
+        ) for script in map(dict, sqlite_cursor) if script['id'] not in existing_script_ids))
         
-        # Migrate submissions
+        # Migrate submissions; large tables go through COPY
+        submission_count = sqlite_cursor.execute("SELECT COUNT(*) FROM submission").fetchone()[0]
         sqlite_cursor.execute("SELECT * FROM submission")
-        submissions = sqlite_cursor.fetchall()
+        submission_rows = ((
+            submission['id'], submission['user_id'], submission.get('script_id'),
+            submission.get('text_content'), submission['audio_filename'],
+            submission.get('status', 'pending'), submission.get('created_at'),
+            submission.get('reviewed_at'), submission.get('reviewed_by'),
+            submission.get('review_notes'), submission.get('quality_score'),
+            submission.get('word_count', 0), submission.get('duration', 0.0)
+        ) for submission in map(dict, sqlite_cursor))
         
-        for submission in submissions:
-            pg_cursor.execute("""
-                INSERT INTO submissions (id, user_id, script_id, text_content, audio_filename,
-                                       status, created_at, reviewed_at, reviewed_by, review_notes,
-                                       quality_score, word_count, duration)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        if submission_count >= COPY_THRESHOLD:
+            copy_submissions(pg_conn, submission_rows)
+        else:
+            insert_in_batches(pg_conn, f"""
+                INSERT INTO submissions ({SUBMISSION_COLUMNS})
+                VALUES %s
                 ON CONFLICT DO NOTHING
-            """, (
-                submission['id'], submission['user_id'], submission.get('script_id'),
-                submission.get('text_content'), submission['audio_filename'],
-                submission.get('status', 'pending'), submission.get('created_at'),
-                submission.get('reviewed_at'), submission.get('reviewed_by'),
-                submission.get('review_notes'), submission.get('quality_score'),
-                submission.get('word_count', 0), submission.get('duration', 0.0)
-            ))
+            """, submission_rows)
         
-        pg_conn.commit()
-        pg_cursor.close()
+        # SQLite submissions carry no speaker snapshot; take it from each submitter's
+        # profile in one set-based UPDATE rather than one per submission
+        with pg_conn.cursor() as pg_cursor:
+            pg_cursor.execute("""
+                UPDATE submissions s
+                SET provider_gender = u.gender, provider_age_group = u.age_group
+                FROM users u
+                WHERE s.user_id = u.id AND s.provider_gender IS NULL
+            """)
+            pg_conn.commit()
         
         print("✅ Data migration completed successfully")
         return True
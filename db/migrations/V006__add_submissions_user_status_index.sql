@@ -0,0 +1,5 @@
+-- Composite index backing the provider dashboard stats query
+-- (SELECT status, COUNT(*) FROM submissions WHERE user_id = ? GROUP BY status)
+-- lets PostgreSQL answer the grouped count with a single index-only scan
+
+CREATE INDEX IF NOT EXISTS idx_submissions_user_status ON submissions(user_id, status);
@@ -0,0 +1,13 @@
+-- Trigram indexes for the /api/scripts search box
+-- The endpoint filters with ILIKE '%term%' on title, content and category;
+-- GIN trigram indexes let PostgreSQL serve those substring matches without
+-- scanning every script row
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_scripts_title_trgm ON scripts USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_scripts_content_trgm ON scripts USING gin (content gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_scripts_category_trgm ON scripts USING gin (category gin_trgm_ops);
+
+-- Keyset pagination order for the script listing
+CREATE INDEX IF NOT EXISTS idx_scripts_created_at_id ON scripts(created_at DESC, id DESC);
@@ -0,0 +1,9 @@
+-- Covering index for the provider dashboard earnings total
+-- (SELECT SUM(amount) FROM billing_records WHERE user_id = ?)
+-- INCLUDE (amount) lets PostgreSQL answer the sum with an index-only scan
+-- instead of visiting every billing row in the heap
+
+CREATE INDEX IF NOT EXISTS idx_billing_user_id_amount ON billing_records(user_id) INCLUDE (amount);
+
+-- Superseded by the covering index above (same leading column)
+DROP INDEX IF EXISTS idx_billing_user_id;
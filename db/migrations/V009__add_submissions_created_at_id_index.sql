@@ -0,0 +1,6 @@
+-- Keyset pagination order for the /submissions list
+-- Admins page through every submission; providers page through their own
+-- rows, so both orderings get an index that matches ORDER BY exactly
+
+CREATE INDEX IF NOT EXISTS idx_submissions_created_at_id ON submissions(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_submissions_user_created_at_id ON submissions(user_id, created_at DESC, id DESC);
@@ -0,0 +1,12 @@
+-- Store each script's word count so recording submissions can read a single
+-- integer instead of loading and splitting the full script content.
+-- The application keeps it in sync whenever content is set.
+
+ALTER TABLE scripts ADD COLUMN IF NOT EXISTS word_count INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill existing scripts (same whitespace splitting as Python's str.split())
+UPDATE scripts
+SET word_count = CASE
+    WHEN btrim(content) = '' THEN 0
+    ELSE array_length(regexp_split_to_array(btrim(content), '\s+'), 1)
+END;
@@ -0,0 +1,9 @@
+-- Index for the reviewer dashboard's recent reviews
+-- (WHERE reviewed_by = ? ORDER BY reviewed_at DESC LIMIT 10)
+-- The index matches the filter and sort order, so PostgreSQL reads the first
+-- ten entries instead of scanning and sorting a reviewer's whole history.
+-- Unreviewed submissions have no reviewer and are left out of the index.
+
+CREATE INDEX IF NOT EXISTS idx_submissions_reviewer_recent
+    ON submissions(reviewed_by, reviewed_at DESC)
+    WHERE reviewed_by IS NOT NULL;
@@ -0,0 +1,8 @@
+-- Index for the per-script demographic progress matrix
+-- (SELECT provider_gender, provider_age_group, status, COUNT(*) FROM submissions
+--  WHERE script_id = ? GROUP BY provider_gender, provider_age_group, status)
+-- Every referenced column is in the index, so the count is an index-only scan
+-- over already-grouped tuples
+
+CREATE INDEX IF NOT EXISTS idx_submissions_script_progress
+    ON submissions(script_id, provider_gender, provider_age_group, status);
@@ -0,0 +1,5 @@
+-- Index for the recording queue's "not yet recorded by this user" check
+-- (NOT EXISTS (SELECT 1 FROM submissions WHERE script_id = scripts.id AND user_id = ?))
+-- Each candidate script is then ruled in or out with a single index probe
+
+CREATE INDEX IF NOT EXISTS idx_submissions_user_script ON submissions(user_id, script_id);
@@ -0,0 +1,10 @@
+-- Composite index for the earnings page
+-- (SELECT ... FROM billing_records WHERE user_id = ? AND billing_type = ?
+--  ORDER BY created_at DESC LIMIT 50) walks the index in order instead of sorting,
+-- and INCLUDE (amount) keeps the grouped SUM per billing type index-only
+
+CREATE INDEX IF NOT EXISTS idx_billing_user_type_created
+    ON billing_records(user_id, billing_type, created_at DESC) INCLUDE (amount);
+
+-- Superseded by the index above (same leading column, also covers amount)
+DROP INDEX IF EXISTS idx_billing_user_id_amount;
@@ -0,0 +1,13 @@
+-- Per-script submission lists ordered newest first
+-- (WHERE script_id = ? [AND user_id = ?] ORDER BY created_at DESC) and the
+-- data export's language filter (WHERE language_id = ? ORDER BY created_at DESC)
+-- read rows in index order instead of sorting the filtered set
+
+CREATE INDEX IF NOT EXISTS idx_submissions_script_created ON submissions(script_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_submissions_user_script_created ON submissions(user_id, script_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_submissions_language_created ON submissions(language_id, created_at DESC);
+
+-- Superseded by the indexes above (same leading columns)
+DROP INDEX IF EXISTS idx_submissions_script_id;
+DROP INDEX IF EXISTS idx_submissions_user_script;
+DROP INDEX IF EXISTS idx_submissions_language_id;
@@ -0,0 +1,9 @@
+-- Pending review queues
+-- (WHERE status = 'pending' ORDER BY created_at [ASC|DESC])
+-- The reviewer and admin queues read pending rows straight off the index in
+-- either direction instead of fetching every pending row and sorting it
+
+CREATE INDEX IF NOT EXISTS idx_submissions_status_created ON submissions(status, created_at);
+
+-- Superseded by the index above (same leading column)
+DROP INDEX IF EXISTS idx_submissions_status;
@@ -0,0 +1,25 @@
+-- One pricing row per language
+-- Billing and the pricing admin create a language's row on first use with
+-- INSERT ... ON CONFLICT DO NOTHING, which needs a unique key to conflict on.
+-- Without one, concurrent first approvals could each insert a default row.
+
+-- pricing_rates has so far been created by the app's create_all(); create it
+-- here too so a fresh database can run this migration before the app starts
+CREATE TABLE IF NOT EXISTS pricing_rates (
+    id SERIAL PRIMARY KEY,
+    language_code VARCHAR(10) NOT NULL REFERENCES languages(code),
+    provider_rate_per_word FLOAT,
+    reviewer_rate_per_submission FLOAT,
+    currency VARCHAR(10),
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP
+);
+
+-- Keep the oldest row per language; later duplicates are the default rows
+-- approvals added when they missed an existing rate
+DELETE FROM pricing_rates p
+USING pricing_rates keep
+WHERE p.language_code = keep.language_code
+  AND p.id > keep.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_pricing_rates_language_code ON pricing_rates(language_code);
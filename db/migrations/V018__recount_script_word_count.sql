@@ -0,0 +1,7 @@
+-- Recount scripts.word_count
+-- V010's backfill trimmed with btrim(), which strips only spaces, so content
+-- with leading or trailing newlines or tabs was counted one or two words too
+-- high. Count the runs of non-whitespace instead, matching Python's str.split().
+
+UPDATE scripts
+SET word_count = (SELECT count(*) FROM regexp_matches(content, '\S+', 'g'));
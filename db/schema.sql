@@ -36,6 +36,7 @@ CREATE TABLE IF NOT EXISTS scripts (
     content TEXT NOT NULL,
     language VARCHAR(10) DEFAULT 'en',
     is_active BOOLEAN DEFAULT TRUE,
+    word_count INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -1,13 +1,26 @@
 # Gunicorn configuration file for production deployment
 import os
 
+# Set GUNICORN_WORKER_CLASS=gevent (requires the gevent and psycogreen packages)
+# to let psycopg2 yield to other greenlets while waiting on PostgreSQL.
+# Patching happens here because the config is loaded before preload_app imports the app.
+if os.environ.get("GUNICORN_WORKER_CLASS") == "gevent":
+    from gevent import monkey
+    monkey.patch_all()
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
 # Server socket
 bind = "0.0.0.0:8000"
 backlog = 2048
 
 # Worker processes
-workers = 4
-worker_class = "sync"
+# Handlers are I/O-bound (DB round-trips, audio upload writes), so each process
+# runs a pool of threads instead of blocking on one request at a time; a couple
+# of processes is enough and leaves CPU for PostgreSQL
+workers = int(os.environ.get("GUNICORN_WORKERS", 2))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
 worker_connections = 1000
 timeout = 120
 keepalive = 2
@@ -26,6 +39,7 @@ access_log_format = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s"
 proc_name = "voicescript-collector"
 
 # Server mechanics
+# Works with gthread too: threads are started in each worker after the fork
 preload_app = True
 daemon = False
 pidfile = "/tmp/gunicorn.pid"
@@ -34,6 +48,15 @@ pidfile = "/tmp/gunicorn.pid"
 # group = "appuser"  # Only use in Docker with proper user setup
 tmp_upload_dir = None
 
+def post_fork(server, worker):
+    """Give each worker its own connection pool"""
+    # preload_app imports the app (and may open pooled connections) in the master;
+    # the forked worker must not reuse those sockets, so it forgets them without
+    # closing them and opens fresh ones on first use
+    from app import app, db
+    with app.app_context():
+        db.engine.dispose(close=False)
+
 # SSL (if needed in production)
 # keyfile = None
 # certfile = None
\ No newline at end of file
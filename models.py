@@ -1,9 +1,14 @@
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import validates
 from werkzeug.security import generate_password_hash, check_password_hash
 
 db = SQLAlchemy()
 
+def count_words(text):
+    """Whitespace-separated word count used for scripts and submissions"""
+    return len(text.split()) if text else 0
+
 class User(db.Model):
     __tablename__ = 'users'
     
@@ -38,7 +43,13 @@ class Script(db.Model):
     target_duration = db.Column(db.Integer)  # in seconds
     language = db.Column(db.String(10), default='en')
     is_active = db.Column(db.Boolean, default=True)
+    word_count = db.Column(db.Integer, default=0, nullable=False)  # Kept in sync with content
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    @validates('content')
+    def _update_word_count(self, key, content):
+        self.word_count = count_words(content)
+        return content
 
 class ScriptVariantRequirement(db.Model):
     __tablename__ = 'script_variant_requirements'
@@ -118,7 +129,7 @@ class Language(db.Model):
 class PricingRate(db.Model):
     __tablename__ = 'pricing_rates'
     id = db.Column(db.Integer, primary_key=True)
-    language_code = db.Column(db.String(10), db.ForeignKey('languages.code'), nullable=False)
+    language_code = db.Column(db.String(10), db.ForeignKey('languages.code'), unique=True, nullable=False)
     provider_rate_per_word = db.Column(db.Float, default=0.01)  # Rate paid to providers
     reviewer_rate_per_submission = db.Column(db.Float, default=2.00)  # Fixed rate per review
     currency = db.Column(db.String(10), default='USD')  # Currency code (USD, EUR, BDT, etc.)
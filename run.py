@@ -2,14 +2,31 @@
 """
 Simple runner for the VoiceScript Collector Flask application
 For local development only (not used by Docker)
+
+Set PROFILE=1 to write a cProfile dump per request to ./profiles
 """
 
+import os
+
 from app import app
 
 if __name__ == '__main__':
+    profiling = os.environ.get('PROFILE') == '1'
+    if profiling:
+        from werkzeug.middleware.profiler import ProfilerMiddleware
+        os.makedirs('profiles', exist_ok=True)
+        app.wsgi_app = ProfilerMiddleware(
+            app.wsgi_app,
+            profile_dir='profiles',
+            sort_by=('cumulative',),
+            restrictions=[30]  # Top 30 entries in the per-request summary
+        )
+    
     # Database initialization is automatic (handles both migrations and fallback)
     app.run(
         host='0.0.0.0',
         port=5000,
-        debug=True
-    )
\ No newline at end of file
+        # The debugger and reloader add their own frames and a second process to the profile
+        debug=not profiling,
+        use_reloader=not profiling
+    )
@@ -1 +1,7 @@
-# Tests package for VoiceScript Collector
\ No newline at end of file
+# Tests package for VoiceScript Collector
+import os
+
+# Every test module imports the app, so point it at a private in-memory database
+# before any of them does; the app builds its schema once, on import
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ['INIT_DB_ON_IMPORT'] = '1'
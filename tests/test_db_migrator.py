@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Migration Runner Tests
+Tests how migration files are split into the statements that get executed
+"""
+
+import glob
+import os
+import unittest
+
+from db_migrator import MigrationRunner
+
+class SplitSqlStatementsTestCase(unittest.TestCase):
+    """Test the fast SQL splitter used for migrations"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.runner = MigrationRunner()
+
+    def test_dollar_quoted_body_keeps_semicolons(self):
+        """Test semicolons inside $$ and $tag$ bodies don't end the statement"""
+        sql = (
+            "CREATE FUNCTION touch() RETURNS trigger AS $$\n"
+            "BEGIN NEW.updated_at := now(); RETURN NEW; END;\n"
+            "$$ LANGUAGE plpgsql;\n"
+            "DO $body$ BEGIN PERFORM 1; END $body$;\n"
+            "SELECT 1;"
+        )
+        statements = self.runner.split_sql_statements(sql)
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(statements[0].startswith('CREATE FUNCTION'))
+        self.assertTrue(statements[0].endswith('LANGUAGE plpgsql;'))
+        self.assertEqual(statements[1], "DO $body$ BEGIN PERFORM 1; END $body$;")
+
+    def test_escape_string_keeps_semicolons(self):
+        """Test a backslash-escaped quote in an E'' string doesn't end the literal"""
+        sql = "INSERT INTO notes VALUES (E'it\\'s; fine', 'a''b; c');\nSELECT 2;"
+        statements = self.runner.split_sql_statements(sql)
+        self.assertEqual(statements, [
+            "INSERT INTO notes VALUES (E'it\\'s; fine', 'a''b; c');",
+            "SELECT 2;"
+        ])
+
+    def test_statement_with_leading_comment_is_kept(self):
+        """Test comments in front of a statement don't cause it to be dropped"""
+        sql = (
+            "-- Add the column; older databases lack it\n"
+            "/* see V002 */\n"
+            "ALTER TABLE submissions ADD COLUMN IF NOT EXISTS transcript TEXT;"
+        )
+        statements = self.runner.split_sql_statements(sql)
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith('-- Add the column'))
+        self.assertTrue(statements[0].endswith('transcript TEXT;'))
+
+    def test_comment_only_chunk_is_dropped(self):
+        """Test trailing comments and stray semicolons produce no statement"""
+        sql = "SELECT 1;\n-- trailing note; still a comment\n/* block; comment */\n;\n"
+        self.assertEqual(self.runner.split_sql_statements(sql), ["SELECT 1;"])
+
+    def test_matches_sqlparse_on_migrations(self):
+        """Test the fast splitter agrees with strict (sqlparse) mode on every migration"""
+        strict_runner = MigrationRunner(strict=True)
+        paths = sorted(glob.glob(os.path.join(self.runner.migrations_path, '*.sql')))
+        self.assertTrue(paths)
+
+        for path in paths:
+            with open(path, 'r') as f:
+                content = f.read()
+            with self.subTest(migration=os.path.basename(path)):
+                self.assertEqual(
+                    self.runner.split_sql_statements(content),
+                    strict_runner.split_sql_statements(content)
+                )
+
+if __name__ == '__main__':
+    unittest.main()
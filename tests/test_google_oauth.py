@@ -4,27 +4,68 @@ Google OAuth Integration Tests
 Tests Google authentication flow and user account linking
 """
 
+import functools
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import json
+
+from flask import redirect
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+from werkzeug.security import generate_password_hash
 from app import app, db, User
 
 class GoogleOAuthTestCase(unittest.TestCase):
     """Test Google OAuth integration"""
     
-    def setUp(self):
-        """Set up test environment"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the app context, test client and the connection tests run on"""
         app.config['TESTING'] = True
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
         app.config['WTF_CSRF_ENABLED'] = False
         app.config['GOOGLE_CLIENT_ID'] = 'test_client_id'
         app.config['GOOGLE_CLIENT_SECRET'] = 'test_client_secret'
         
-        self.app = app.test_client()
-        self.app_context = app.app_context()
-        self.app_context.push()
+        cls.app = app.test_client()
+        cls.app_context = app.app_context()
+        cls.app_context.push()
+        
+        # Nothing here exercises password strength, so hash with a single PBKDF2
+        # round instead of the production work factor; check_password still works
+        cls.password_hash_patcher = patch(
+            'models.generate_password_hash',
+            functools.partial(generate_password_hash, method='pbkdf2:sha256:1')
+        )
+        cls.password_hash_patcher.start()
+        
+        cls.app_session = db.session
+        cls.connection = db.engine.connect()
+        # pysqlite opens and ends transactions implicitly, which would let a RELEASE
+        # SAVEPOINT commit test data; have SQLAlchemy emit BEGIN itself instead
+        cls.connection.connection.driver_connection.isolation_level = None
+        event.listen(cls.connection, 'begin', lambda conn: conn.exec_driver_sql('BEGIN'))
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared connection, drop the schema and pop the app context"""
+        cls.connection.close()
+        db.session = cls.app_session
+        db.drop_all()
+        cls.password_hash_patcher.stop()
+        cls.app_context.pop()
+    
+    def setUp(self):
+        """Set up test environment"""
+        # Each test runs inside an outer transaction that is rolled back afterwards;
+        # the app's own commits only release savepoints within it
+        self.transaction = self.connection.begin()
+        db.session = scoped_session(sessionmaker(
+            bind=self.connection, join_transaction_mode='create_savepoint'
+        ))
         
-        db.create_all()
+        # The client is shared, so start every test logged out
+        with self.app.session_transaction() as client_session:
+            client_session.clear()
         
         # Create existing user for account linking test
         self.existing_user = User(
@@ -37,19 +78,33 @@ class GoogleOAuthTestCase(unittest.TestCase):
         self.existing_user.set_password('testpass')
         db.session.add(self.existing_user)
         db.session.commit()
+        self.existing_user_id = self.existing_user.id
     
     def tearDown(self):
         """Clean up"""
         db.session.remove()
-        db.drop_all()
-        self.app_context.pop()
+        self.transaction.rollback()
+    
+    # Profile fields every mocked Google account shares unless a test overrides them
+    GOOGLE_USERINFO = {
+        'given_name': 'Test',
+        'family_name': 'User',
+        'picture': 'https://example.com/pic.jpg'
+    }
+    
+    def mock_google_token(self, mock_google, sub, email, **userinfo):
+        """Have the mocked Google client return a token for the given account"""
+        mock_google.authorize_access_token.return_value = {
+            'userinfo': {**self.GOOGLE_USERINFO, 'sub': sub, 'email': email, **userinfo}
+        }
     
     def test_google_login_redirect(self):
         """Test Google login initiates OAuth redirect"""
         with patch('app.google') as mock_google:
-            mock_google.authorize_redirect.return_value = Mock()
+            mock_google.authorize_redirect.return_value = redirect('https://accounts.google.com/o/oauth2/auth')
             rv = self.app.get('/login/google')
             mock_google.authorize_redirect.assert_called_once()
+            self.assertEqual(rv.status_code, 302)
     
     def test_google_login_without_config(self):
         """Test Google login when not configured"""
@@ -67,16 +122,7 @@ class GoogleOAuthTestCase(unittest.TestCase):
     def test_google_callback_new_user(self, mock_google):
         """Test Google callback creates new user"""
         # Mock Google token response
-        mock_token = {
-            'userinfo': {
-                'sub': 'google_user_123',
-                'email': 'newuser@gmail.com',
-                'given_name': 'New',
-                'family_name': 'User',
-                'picture': 'https://example.com/pic.jpg'
-            }
-        }
-        mock_google.authorize_access_token.return_value = mock_token
+        self.mock_google_token(mock_google, 'google_user_123', 'newuser@gmail.com', given_name='New')
         
         rv = self.app.get('/callback/google', follow_redirects=True)
         self.assertEqual(rv.status_code, 200)
@@ -93,22 +139,16 @@ class GoogleOAuthTestCase(unittest.TestCase):
     def test_google_callback_account_linking(self, mock_google):
         """Test Google callback links to existing account"""
         # Mock Google token for existing user email
-        mock_token = {
-            'userinfo': {
-                'sub': 'google_user_456',
-                'email': 'existing@test.com',
-                'given_name': 'Existing',
-                'family_name': 'User',
-                'picture': 'https://example.com/newpic.jpg'
-            }
-        }
-        mock_google.authorize_access_token.return_value = mock_token
+        self.mock_google_token(
+            mock_google, 'google_user_456', 'existing@test.com',
+            given_name='Existing', picture='https://example.com/newpic.jpg'
+        )
         
         rv = self.app.get('/callback/google', follow_redirects=True)
         self.assertEqual(rv.status_code, 200)
         
         # Verify existing user was updated with Google info
-        updated_user = User.query.filter_by(email='existing@test.com').first()
+        updated_user = db.session.get(User, self.existing_user_id)
         self.assertEqual(updated_user.google_id, 'google_user_456')
         self.assertEqual(updated_user.auth_provider, 'google')
         self.assertEqual(updated_user.profile_picture, 'https://example.com/newpic.jpg')
@@ -129,16 +169,7 @@ class GoogleOAuthTestCase(unittest.TestCase):
         db.session.commit()
         
         # Mock returning user token
-        mock_token = {
-            'userinfo': {
-                'sub': 'existing_google_123',
-                'email': 'googleuser@gmail.com',
-                'given_name': 'Google',
-                'family_name': 'User',
-                'picture': 'https://example.com/pic.jpg'
-            }
-        }
-        mock_google.authorize_access_token.return_value = mock_token
+        self.mock_google_token(mock_google, 'existing_google_123', 'googleuser@gmail.com', given_name='Google')
         
         rv = self.app.get('/callback/google', follow_redirects=True)
         self.assertEqual(rv.status_code, 200)
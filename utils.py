@@ -1,96 +1,154 @@
 import os
+import re
+import time
 import functools
-from flask import session, redirect, url_for, flash, request
-from models import AppSettings, db
+from flask import session, redirect, url_for, flash, request, current_app
+from sqlalchemy.dialects import postgresql, sqlite
+from models import AppSettings, User, db
 from datetime import datetime
 
+# Process-local cache for rarely-changing lookups (languages, app settings)
+# Each entry is (stored_at, value); writers call invalidate_cache() so this
+# process sees changes immediately, other workers within the TTL.
+_cache = {}
+
+def cached(key, ttl, loader):
+    """Return the cached value for key, calling loader() on a miss or once ttl seconds have passed"""
+    entry = _cache.get(key)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    value = loader()
+    _cache[key] = (now, value)
+    return value
+
+def invalidate_cache(*keys):
+    """Drop cached entries so the next lookup reloads them"""
+    for key in keys:
+        _cache.pop(key, None)
+
 # App settings helpers
+# All settings are read as one {key: value} snapshot so a page that checks
+# several settings still costs at most one query per TTL window
+SETTINGS_CACHE_KEY = 'app_settings'
+SETTINGS_CACHE_TTL = 60  # seconds
+# Dialect-specific INSERT constructs that support ON CONFLICT, by dialect name
+UPSERT_INSERTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+def load_app_settings():
+    """Return every application setting as a dict, loading the snapshot if it is stale"""
+    return cached(SETTINGS_CACHE_KEY, SETTINGS_CACHE_TTL, lambda: dict(
+        db.session.query(AppSettings.setting_key, AppSettings.setting_value).all()
+    ))
+
 def get_app_setting(key, default_value=''):
     """Get application setting value with fallback to default"""
-    setting = AppSettings.query.filter_by(setting_key=key).first()
-    return setting.setting_value if setting else default_value
+    return load_app_settings().get(key, default_value)
+
+# (settings snapshot, parsed flag); re-parsed only when the snapshot is replaced,
+# so it can never be staler than the settings themselves
+_show_earnings = (None, True)
 
 def get_show_earnings():
     """Get earnings visibility setting as boolean"""
-    setting_value = get_app_setting('show_earnings', 'true')
-    return setting_value.lower() == 'true'
+    global _show_earnings
+    settings = load_app_settings()
+    if _show_earnings[0] is not settings:
+        _show_earnings = (settings, settings.get('show_earnings', 'true').lower() == 'true')
+    return _show_earnings[1]
 
 def set_app_setting(key, value, description=''):
-    """Set application setting value"""
-    setting = AppSettings.query.filter_by(setting_key=key).first()
-    if setting:
-        setting.setting_value = value
-        setting.updated_at = datetime.utcnow()
-    else:
-        setting = AppSettings(
-            setting_key=key,
-            setting_value=value,
-            description=description
-        )
-        db.session.add(setting)
+    """Set application setting value with a single INSERT ... ON CONFLICT DO UPDATE"""
+    insert = UPSERT_INSERTS[db.session.get_bind().dialect.name]
+    stmt = insert(AppSettings).values(
+        setting_key=key,
+        setting_value=value,
+        description=description
+    )
+    # ORM onupdate hooks don't run for the conflict branch, so stamp updated_at here
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AppSettings.setting_key],
+        set_={'setting_value': stmt.excluded.setting_value, 'updated_at': datetime.utcnow()}
+    )
+    db.session.execute(stmt)
     db.session.commit()
+    invalidate_cache(SETTINGS_CACHE_KEY)
+
+# Current user helpers
+def current_user_profile():
+    """Return the logged-in user's id, first name and demographics as a row, or None.
+    
+    Handlers that only need these fields use this instead of loading the full User.
+    """
+    return db.session.query(
+        User.id, User.first_name, User.gender, User.age_group
+    ).filter_by(id=session['user_id']).first()
 
 # Authentication decorators
+# Whether the dev-only webview fallback is on cannot change while the process runs,
+# so it is decided once here and require_auth builds only the check it needs
+IS_PRODUCTION = os.environ.get('FLASK_ENV') == 'production'
+WEBVIEW_FALLBACK_ENABLED = (
+    not IS_PRODUCTION and os.environ.get('ENABLE_WEBVIEW_FALLBACK', 'false').lower() == 'true'
+)
+
+# Dev-only fallback credentials are "<user_id>:<role>:<name>" tokens; anything
+# else is ignored rather than parsed and caught
+FALLBACK_TOKEN_PATTERN = re.compile(r'(\d+):([^:]+):(.+)')
+FALLBACK_COOKIE_NAMES = ('voicescript_session', 'replit_auth_backup', 'session_backup')
+
 def require_auth(f):
+    if not WEBVIEW_FALLBACK_ENABLED:
+        @functools.wraps(f)
+        def decorated_function(*args, **kwargs):
+            if 'user_id' in session:
+                return f(*args, **kwargs)
+            flash('Please log in to access this page.', 'error')
+            return redirect(url_for('login'))
+        return decorated_function
+    
     @functools.wraps(f)
     def decorated_function(*args, **kwargs):
-        # Get app and is_production from current app context
-        from flask import current_app as app
-        is_production = os.environ.get('FLASK_ENV') == 'production'
-        
         # Primary session authentication
         if 'user_id' in session:
             return f(*args, **kwargs)
         
-        # Fallback authentication ONLY in development mode (SECURITY: disabled in production)
-        enable_fallback = os.environ.get('ENABLE_WEBVIEW_FALLBACK', 'false').lower() == 'true'
+        # Fallback authentication for Replit webview environment (DEV ONLY)
+        for cookie_name in FALLBACK_COOKIE_NAMES:
+            match = FALLBACK_TOKEN_PATTERN.fullmatch(request.cookies.get(cookie_name, ''))
+            if match:
+                user_id, user_role, user_name = match.groups()
+                session.permanent = True
+                session['user_id'] = int(user_id)
+                session['user_role'] = user_role
+                session['user_name'] = user_name
+                session.modified = True
+                current_app.logger.warning(f"Fallback auth used: {user_role} (DEV ONLY)")
+                return f(*args, **kwargs)
         
-        if enable_fallback and not is_production:
-            # Fallback authentication for Replit webview environment (DEV ONLY)
-            fallback_cookies = [
-                request.cookies.get('voicescript_session'),
-                request.cookies.get('replit_auth_backup'),
-                request.cookies.get('session_backup')
-            ]
-            
-            for cookie_auth in fallback_cookies:
-                if cookie_auth:
-                    try:
-                        user_id, user_role, user_name = cookie_auth.split(':', 2)
-                        session.permanent = True
-                        session['user_id'] = int(user_id)
-                        session['user_role'] = user_role
-                        session['user_name'] = user_name
-                        session.modified = True
-                        app.logger.warning(f"Fallback auth used: {user_role} (DEV ONLY)")
-                        return f(*args, **kwargs)
-                    except (ValueError, IndexError):
-                        continue
-            
-            # Last resort: Check URL token for webview authentication (DEV ONLY)
-            auth_token = request.args.get('auth_token')
-            if auth_token:
-                try:
-                    user_id, user_role, user_name = auth_token.split(':', 2)
-                    session.permanent = True
-                    session['user_id'] = int(user_id)
-                    session['user_role'] = user_role
-                    session['user_name'] = user_name
-                    session.modified = True
-                    app.logger.warning(f"Token auth used: {user_role} (DEV ONLY)")
-                    return f(*args, **kwargs)
-                except (ValueError, IndexError):
-                    pass
+        # Last resort: Check URL token for webview authentication (DEV ONLY)
+        match = FALLBACK_TOKEN_PATTERN.fullmatch(request.args.get('auth_token', ''))
+        if match:
+            user_id, user_role, user_name = match.groups()
+            session.permanent = True
+            session['user_id'] = int(user_id)
+            session['user_role'] = user_role
+            session['user_name'] = user_name
+            session.modified = True
+            current_app.logger.warning(f"Token auth used: {user_role} (DEV ONLY)")
+            return f(*args, **kwargs)
         
         flash('Please log in to access this page.', 'error')
         return redirect(url_for('login'))
     return decorated_function
 
 def require_role(required_roles):
+    # Frozen once per route; a bare string is one role, not a set of characters to match
+    roles = frozenset([required_roles] if isinstance(required_roles, str) else required_roles)
     def decorator(f):
         @functools.wraps(f)
         def decorated_function(*args, **kwargs):
-            if 'user_role' not in session or session['user_role'] not in required_roles:
+            if session.get('user_role') not in roles:
                 flash('Access denied. Insufficient privileges.', 'error')
                 return redirect(url_for('index'))
             return f(*args, **kwargs)